@@ -1,2 +1,4 @@
-pyside6-rcc recursos.qrc -o recursos_rc.py
+python tools\otimizar_imagens.py
+pyside6-rcc --binary recursos_otimizados.qrc -o recursos.rcc
 pyside6-uic Screen.ui -o Screen.py
+python tools\compilar_telas.py
@@ -128,7 +128,6 @@ class Ui_Dialog(object):
         self.painel5.setEnabled(True)
         self.painel5.setGeometry(QRect(910, 190, 201, 208))
         self.painel5.setStyleSheet(u"")
-        self.painel5.setPixmap(QPixmap(u":/imagens/imagens/SKILL5.png"))
         self.painel5.setScaledContents(True)
         self.label = QLabel(self.framePrincipal)
         self.label.setObjectName(u"label")
@@ -155,7 +154,6 @@ class Ui_Dialog(object):
         self.painel9.setEnabled(True)
         self.painel9.setGeometry(QRect(810, 465, 201, 208))
         self.painel9.setStyleSheet(u"")
-        self.painel9.setPixmap(QPixmap(u":/imagens/imagens/SKILL8.png"))
         self.painel9.setScaledContents(True)
         self.label_2 = QLabel(self.framePrincipal)
         self.label_2.setObjectName(u"label_2")
@@ -249,7 +247,6 @@ class Ui_Dialog(object):
         self.painel1.setEnabled(True)
         self.painel1.setGeometry(QRect(85, 190, 201, 208))
         self.painel1.setStyleSheet(u"")
-        self.painel1.setPixmap(QPixmap(u":/imagens/imagens/SKILL1.png"))
         self.painel1.setScaledContents(True)
         self.painel1.setTextInteractionFlags(Qt.TextInteractionFlag.LinksAccessibleByMouse)
         self.process = QProgressBar(self.framePrincipal)
@@ -268,14 +265,12 @@ class Ui_Dialog(object):
         self.painel6.setEnabled(True)
         self.painel6.setGeometry(QRect(190, 465, 201, 208))
         self.painel6.setStyleSheet(u"")
-        self.painel6.setPixmap(QPixmap(u":/imagens/imagens/SKILL6.png"))
         self.painel6.setScaledContents(True)
         self.painel7 = QLabel(self.framePrincipal)
         self.painel7.setObjectName(u"painel7")
         self.painel7.setEnabled(True)
         self.painel7.setGeometry(QRect(400, 465, 201, 208))
         self.painel7.setStyleSheet(u"")
-        self.painel7.setPixmap(QPixmap(u":/imagens/imagens/SKILL7.png"))
         self.painel7.setScaledContents(True)
         self.java = QProgressBar(self.framePrincipal)
         self.java.setObjectName(u"java")
@@ -293,14 +288,12 @@ class Ui_Dialog(object):
         self.painel8.setEnabled(True)
         self.painel8.setGeometry(QRect(610, 465, 201, 208))
         self.painel8.setStyleSheet(u"")
-        self.painel8.setPixmap(QPixmap(u":/imagens/imagens/SKILL9.png"))
         self.painel8.setScaledContents(True)
         self.painel3 = QLabel(self.framePrincipal)
         self.painel3.setObjectName(u"painel3")
         self.painel3.setEnabled(True)
         self.painel3.setGeometry(QRect(510, 190, 201, 208))
         self.painel3.setStyleSheet(u"")
-        self.painel3.setPixmap(QPixmap(u":/imagens/imagens/SKILL3.png"))
         self.painel3.setScaledContents(True)
         self.vba = QProgressBar(self.framePrincipal)
         self.vba.setObjectName(u"vba")
@@ -317,7 +310,6 @@ class Ui_Dialog(object):
         self.painel4.setEnabled(True)
         self.painel4.setGeometry(QRect(710, 190, 201, 208))
         self.painel4.setStyleSheet(u"")
-        self.painel4.setPixmap(QPixmap(u":/imagens/imagens/SKILL4.png"))
         self.painel4.setScaledContents(True)
         self.redes = QProgressBar(self.framePrincipal)
         self.redes.setObjectName(u"redes")
@@ -417,7 +409,6 @@ class Ui_Dialog(object):
         self.painel2.setEnabled(True)
         self.painel2.setGeometry(QRect(300, 190, 201, 208))
         self.painel2.setStyleSheet(u"")
-        self.painel2.setPixmap(QPixmap(u":/imagens/imagens/SKILL2.png"))
         self.painel2.setScaledContents(True)
         self.ia = QProgressBar(self.framePrincipal)
         self.ia.setObjectName(u"ia")
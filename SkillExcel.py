@@ -1,49 +1,170 @@
+import hashlib
+import json
 import openpyxl
 from pathlib import Path
 
+from progresso_store import XlsxStore
+from projetos_index import (
+    MAX_PROJETOS_POR_SKILL,
+    ProjetosIndex,
+    calcular_progressos,
+    contar_projetos,
+    skill_to_folder,
+)
+
+__all__ = [
+    "XLSX_SKILLS",
+    "SHEET_NAME",
+    "ler_planilha",
+    "atualizar_planilha_por_projetos",
+    "gravar_linhas_xlsx",
+    # antes definidos aqui; reexportados para quem ainda importa de SkillExcel
+    "MAX_PROJETOS_POR_SKILL",
+    "calcular_progressos",
+    "contar_projetos",
+    "skill_to_folder",
+]
+
 BASE_DIR = Path(__file__).resolve().parent
 XLSX_SKILLS = BASE_DIR / "data" / "skills.xlsx"
 SHEET_NAME = "Skills"
-MAX_PROJETOS_POR_SKILL = 50
-
 
-def skill_to_folder(skill: str) -> Path:
-    cap = (skill or "").strip()
-    return BASE_DIR / "Projetos" / (cap[:1].upper() + cap[1:].lower())
 
-
-def contar_projetos(skill: str) -> int:
-    pasta = skill_to_folder(skill)
-    if not pasta.exists():
-        return 0
-    return sum(1 for p in pasta.iterdir() if p.is_dir())
+def _caminho_fingerprint(caminho: Path) -> Path:
+    """
+    data/skills.xlsx -> data/skills.fingerprint.json: impressão digital dos
+    últimos valores gravados + mtime/tamanho do xlsx.
+    """
+    return caminho.with_name(caminho.stem + ".fingerprint.json")
+
+
+def _assinatura_xlsx(caminho: Path) -> list:
+    st = caminho.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _fingerprint(valores: dict) -> str:
+    dados = json.dumps(valores, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(dados.encode("utf-8")).hexdigest()
+
+
+def _fingerprint_confere(fp: str, caminho: Path) -> bool:
+    """True se a última gravação/verificação foi destes valores e o xlsx não mudou."""
+    try:
+        salvo = json.loads(_caminho_fingerprint(caminho).read_text(encoding="utf-8"))
+        return salvo.get("valores") == fp and salvo.get("xlsx") == _assinatura_xlsx(
+            caminho
+        )
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def _gravar_fingerprint(fp: str, caminho: Path):
+    destino = _caminho_fingerprint(caminho)
+    try:
+        destino.write_text(
+            json.dumps({"valores": fp, "xlsx": _assinatura_xlsx(caminho)}),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        print(f"[AVISO] Não consegui gravar {destino}: {e}")
+
+
+def ler_planilha(caminho: Path = XLSX_SKILLS) -> dict:
+    """
+    Leitura rápida da aba Skills: { skill: {coluna: valor} }.
+    Usa o modo read_only/data_only do openpyxl, que percorre as linhas em
+    streaming sem montar a planilha inteira na memória.
+    """
+    if not caminho.exists():
+        return {}
+    wb = openpyxl.load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        if SHEET_NAME not in wb.sheetnames:
+            return {}
+        linhas = wb[SHEET_NAME].iter_rows(values_only=True)
+        headers = next(linhas, None) or ()
+        if "skill" not in headers:
+            return {}
+        col_skill = headers.index("skill")
+
+        out = {}
+        for valores in linhas:
+            if col_skill >= len(valores):
+                continue
+            key = valores[col_skill]
+            if isinstance(key, str):
+                out[key.strip().lower()] = {
+                    h: (valores[i] if i < len(valores) else None)
+                    for i, h in enumerate(headers)
+                    if h
+                }
+        return out
+    finally:
+        wb.close()
 
 
-def calcular_progressos(skills: list[str]) -> dict:
-    out = {}
-    for s in skills:
-        c = contar_projetos(s)
-        faltam = max(0, MAX_PROJETOS_POR_SKILL - c)
-        percent = min(100, round((c / MAX_PROJETOS_POR_SKILL) * 100))
-        out[s] = {"count": c, "faltam": faltam, "percent": percent}
-    return out
+def _planilha_confere(desejado: dict, caminho: Path) -> bool:
+    """True se a aba já tem exatamente os valores desejados (leitura read-only)."""
+    atual = ler_planilha(caminho)
+    for s_key, valores in desejado.items():
+        linha = atual.get(s_key)
+        if linha is None or "value" not in linha:
+            return False
+        for col, v in valores.items():
+            if col not in linha or linha[col] != v:
+                return False
+    return True
 
 
 def atualizar_planilha_por_projetos(
-    skills: list[str], sobrescrever_value_com_percent=True
-):
-    if not XLSX_SKILLS.exists():
-        print(f"[AVISO] Planilha não encontrada: {XLSX_SKILLS}")
-        return
-
-    wb = openpyxl.load_workbook(XLSX_SKILLS)
+    skills: list[str],
+    sobrescrever_value_com_percent=True,
+    index: ProjetosIndex = None,
+) -> bool:
+    """
+    Grava projects/missing/percent (e value) por skill na aba Skills e
+    registra a varredura no histórico (mesmo caminho do XlsxStore).
+    Retorna True quando a planilha foi salva.
+    """
+    prog = calcular_progressos(skills, index)
+    if not prog:
+        return False
+    return XlsxStore().gravar(prog, sobrescrever_value_com_percent)
+
+
+def gravar_linhas_xlsx(desejado: dict, caminho: Path = XLSX_SKILLS) -> bool:
+    """
+    Grava { skill: {coluna: valor} } na aba Skills de `caminho`.
+    Só regrava o xlsx se algum valor mudou: primeiro confere a impressão
+    digital dos últimos valores gravados (sem abrir o arquivo), depois
+    compara via ler_planilha() e só então carrega em modo leitura/escrita.
+    Retorna True quando a planilha foi salva.
+    """
+    if not caminho.exists():
+        print(f"[AVISO] Planilha não encontrada: {caminho}")
+        return False
+
+    fp = _fingerprint(desejado)
+    if _fingerprint_confere(fp, caminho):
+        print("[OK] Planilha já está atualizada (nada mudou).")
+        return False
+
+    # Só abre em modo leitura/escrita se algo precisa ser gravado
+    if _planilha_confere(desejado, caminho):
+        _gravar_fingerprint(fp, caminho)
+        print("[OK] Planilha já está atualizada (nada mudou).")
+        return False
+
+    wb = openpyxl.load_workbook(caminho)
     if SHEET_NAME not in wb.sheetnames:
         wb.close()
-        print(f"[AVISO] Aba '{SHEET_NAME}' não encontrada em {XLSX_SKILLS}")
-        return
+        print(f"[AVISO] Aba '{SHEET_NAME}' não encontrada em {caminho}")
+        return False
     ws = wb[SHEET_NAME]
 
     headers_row = 1
+    mudou = False
     headers = {
         cell.value: idx
         for idx, cell in enumerate(ws[headers_row], start=1)
@@ -51,8 +172,10 @@ def atualizar_planilha_por_projetos(
     }
 
     def get_or_create_col(col_name: str) -> int:
+        nonlocal mudou
         if col_name in headers:
             return headers[col_name]
+        mudou = True
         col_idx = ws.max_column + 1
         ws.cell(row=headers_row, column=col_idx, value=col_name)
         headers[col_name] = col_idx
@@ -70,24 +193,41 @@ def atualizar_planilha_por_projetos(
         if isinstance(key, str):
             skill_row[key.strip().lower()] = r
 
-    prog = calcular_progressos(skills)
+    def set_if_changed(row: int, col: int, valor):
+        nonlocal mudou
+        cell = ws.cell(row=row, column=col)
+        if cell.value != valor:
+            cell.value = valor
+            mudou = True
 
-    for s in skills:
-        s_key = s.strip().lower()
+    # ws.max_row percorre todas as células: calcula uma vez só
+    proxima_row = ws.max_row + 1
+    for s_key, valores in desejado.items():
         row = skill_row.get(s_key)
         if row is None:
-            row = ws.max_row + 1
+            row = proxima_row
+            proxima_row += 1
             ws.cell(row=row, column=col_skill, value=s_key)
             skill_row[s_key] = row
+            mudou = True
+
+        for col_name, col_idx in (
+            ("projects", col_proj),
+            ("missing", col_missing),
+            ("percent", col_percent),
+            ("value", col_value),
+        ):
+            if col_name in valores:
+                set_if_changed(row, col_idx, valores[col_name])
+
+    if not mudou:
+        wb.close()
+        _gravar_fingerprint(fp, caminho)
+        print("[OK] Planilha já está atualizada (nada mudou).")
+        return False
 
-        info = prog[s]
-        ws.cell(row=row, column=col_proj, value=info["count"])
-        ws.cell(row=row, column=col_missing, value=info["faltam"])
-        ws.cell(row=row, column=col_percent, value=info["percent"])
-
-        if sobrescrever_value_com_percent:
-            ws.cell(row=row, column=col_value, value=info["percent"])
-
-    wb.save(XLSX_SKILLS)
+    wb.save(caminho)
     wb.close()
+    _gravar_fingerprint(fp, caminho)
     print("[OK] Planilha atualizada com projects / missing / percent.")
+    return True
@@ -175,9 +175,16 @@ document.addEventListener("DOMContentLoaded", function () {
     var skills = Array.isArray(json.skills) ? json.skills : [];
     var dados = json.dados || {};
 
+    var temas = json.temas || {};
+
     skills.forEach(function (skill) {
       var sec = document.getElementById(skill);
       if (!sec) { console.warn("Seção ausente:", skill); return; }
+      // paleta gerada pelo tema.py (mesmas cores do app desktop)
+      var tema = temas[skill];
+      if (tema && tema.base) {
+        sec.style.setProperty("--accent-color", tema.base);
+      }
       var grid = qs('.proj-grid[data-skill="' + skill + '"]', sec);
       if (!grid) {
         grid = document.createElement("div");
@@ -4,25 +4,18 @@ import argparse
 import base64
 import json
 import mimetypes
+import os
 import re
+from html.parser import HTMLParser
 from pathlib import Path
 
-LINK_CSS_RE = re.compile(
-    r'<link\b(?=[^>]*\brel=["\']?stylesheet["\']?)(?=[^>]*\bhref=["\']([^"\']+)["\'])[^>]*>',
-    re.IGNORECASE,
-)
-SCRIPT_SRC_RE = re.compile(
-    r'<script\b(?=[^>]*\bsrc=["\']([^"\']+)["\'])[^>]*>\s*</script>',
-    re.IGNORECASE,
-)
-COUNTS_BLOCK_RE = re.compile(
-    r'<script\b(?=[^>]*\bid=["\']counts["\'])(?=[^>]*\btype=["\']application/json["\'])[^>]*>(.*?)</script>',
-    re.IGNORECASE | re.DOTALL,
-)
 IMG_SRC_RE = re.compile(
     r'(<img\b[^>]*?\bsrc=["\'])([^"\']+)(["\'][^>]*>)',
     re.IGNORECASE,
 )
+REMOTO = ("http://", "https://", "//")
+TAMANHO_BLOCO = 1 << 16
+BLOCO_BASE64 = 3 * (1 << 16)
 
 
 def read_text(path: Path) -> str:
@@ -32,94 +25,174 @@ def read_text(path: Path) -> str:
         raise SystemExit(f"Erro lendo {path}: {e}")
 
 
-def encode_file_as_data_uri(path: Path) -> str:
-    mime, _ = mimetypes.guess_type(path.name)
+def write_file_as_data_uri(out, f, name: str) -> None:
+    """
+    Grava em `out` o data URI do arquivo aberto `f` (binário), em blocos:
+    a memória usada é a de um bloco, não a da imagem inteira.
+    """
+    mime, _ = mimetypes.guess_type(name)
     mime = mime or "application/octet-stream"
-    b = path.read_bytes()
-    b64 = base64.b64encode(b).decode("ascii")
-    return f"data:{mime};base64,{b64}"
+    out.write(f"data:{mime};base64,")
+    # múltiplo de 3: cada bloco vira base64 completo, sem "=" no meio
+    for bloco in iter(lambda: f.read(BLOCO_BASE64), b""):
+        out.write(base64.b64encode(bloco).decode("ascii"))
 
 
-def inline_css(html: str, html_dir: Path) -> str:
+def resolver(html_dir: Path, ref: str) -> Path:
+    caminho = (html_dir / ref).resolve()
+    if not caminho.exists():
+        caminho = (html_dir / Path(ref)).resolve()
+    return caminho
 
-    # Substitui <link rel="stylesheet" href="..."> local por <style>...</style>
-    # Ignora links remotos (http/https//)
-    def repl(m: re.Match) -> str:
-        href = m.group(1).strip()
-        if href.startswith(("http://", "https://", "//")):
-            return m.group(0)  # mantém como está
-        css_path = (html_dir / href).resolve()
-        if not css_path.exists():
-            css_path = (html_dir / Path(href)).resolve()
-        css = read_text(css_path)
-        return f"<style>\n{css}\n</style>"
 
-    return LINK_CSS_RE.sub(repl, html)
+def counts_block(counts_path: Path) -> str:
+    counts_json = json.dumps(
+        json.loads(read_text(counts_path)), ensure_ascii=False, indent=2
+    )
+    return f'<script id="counts" type="application/json">\n{counts_json}\n</script>'
 
 
-def inline_js(html: str, html_dir: Path) -> str:
+class Empacotador(HTMLParser):
     """
-    Substitui <script src="..."></script> locais por <script>...</script>
-    Mantém scripts remotos (http/https//) como estão.
+    Reescreve o HTML numa passada só, gravando direto em `out`:
+      - <link rel="stylesheet" href="local"> -> <style>...</style>
+      - <script src="local"></script>        -> <script>...</script>
+      - <script id="counts" ...>             -> JSON do counts_path (ou antes do </body>)
+      - <img src="local">                    -> data URI (se inline_images)
+    Links, scripts e imagens remotos (http/https//) ficam como estão. Todo o
+    resto é copiado byte a byte do original: o HTMLParser avisa cada trecho
+    consumido em updatepos(i, j), e o trecho só não é copiado quando o
+    evento dele foi substituído.
     """
 
-    def repl(m: re.Match) -> str:
-        src = m.group(1).strip()
-
+    def __init__(self, out, html_dir: Path, counts_path=None, inline_images=False):
+        super().__init__(convert_charrefs=False)
+        self.out = out
+        self.html_dir = html_dir
+        self.counts = counts_block(counts_path) if counts_path else None
+        self.inline_images = inline_images
+        self._counts_gravado = False
+        self._pulando = False  # dentro de um <script> já substituído
+        self._trocado = False  # o evento atual já foi escrito (substituído)
+
+    # --- substituições ---
+
+    def _css(self, attrs: dict) -> bool:
+        href = (attrs.get("href") or "").strip()
+        rel = (attrs.get("rel") or "").lower().split()
+        if "stylesheet" not in rel or not href or href.startswith(REMOTO):
+            return False
+        css = read_text(resolver(self.html_dir, href))
+        self.out.write(f"<style>\n{css}\n</style>")
+        return True
+
+    def _js(self, attrs: dict) -> bool:
+        src = (attrs.get("src") or "").strip()
         # Ignora scripts externos (CDNs, Google Fonts etc.)
-        if src.startswith(("http://", "https://", "//")):
-            return m.group(0)
-
-        # Caminho absoluto do JS local
-        js_path = (html_dir / src).resolve()
-        if not js_path.exists():
-            js_path = (html_dir / Path(src)).resolve()
-
+        if not src or src.startswith(REMOTO):
+            return False
         try:
-            js_code = read_text(js_path)
-        except Exception as e:
+            js_code = read_text(resolver(self.html_dir, src))
+        except SystemExit as e:
             print(f"[WARN] Falha ao ler JS '{src}': {e}")
-            return m.group(0)  # mantém o original se não conseguir ler
-
-        return f"<script>\n{js_code}\n</script>"
-
-    return SCRIPT_SRC_RE.sub(repl, html)
-
-
-def inline_counts_json(html: str, counts_path: Path) -> str:
-    counts_json = json.dumps(
-        json.loads(read_text(counts_path)), ensure_ascii=False, indent=2
-    )
-    script_block = (
-        f'<script id="counts" type="application/json">\n{counts_json}\n</script>'
-    )
-
-    if COUNTS_BLOCK_RE.search(html):
-        return COUNTS_BLOCK_RE.sub(script_block, html)
-
-    lower = html.lower()
-    idx = lower.rfind("</body>")
-    if idx != -1:
-        return html[:idx] + script_block + "\n" + html[idx:]
-    return html + "\n" + script_block
-
-
-def inline_images(html: str, html_dir: Path) -> str:
-    # Converte <img src="local"> para data URI (ignora http(s) e data:)
-    def repl(m: re.Match) -> str:
+            return False  # mantém o original se não conseguir ler
+        self.out.write(f"<script>\n{js_code}\n</script>")
+        return True
+
+    def _counts(self, attrs: dict) -> bool:
+        if self.counts is None:
+            return False
+        if attrs.get("id") != "counts" or attrs.get("type") != "application/json":
+            return False
+        if not self._counts_gravado:
+            self.out.write(self.counts)
+            self._counts_gravado = True
+        return True
+
+    def _img(self, tag: str) -> bool:
+        m = IMG_SRC_RE.match(tag)
+        if not m:
+            return False
         prefix, src, suffix = m.groups()
         if src.startswith(("http://", "https://", "data:")):
-            return m.group(0)
-        img_path = (html_dir / src).resolve()
-        if not img_path.exists():
-            img_path = (html_dir / Path(src)).resolve()
+            return False
         try:
-            data_uri = encode_file_as_data_uri(img_path)
-            return f"{prefix}{data_uri}{suffix}"
+            f = resolver(self.html_dir, src).open("rb")
         except Exception:
-            return m.group(0)
-
-    return IMG_SRC_RE.sub(repl, html)
+            return False
+        with f:
+            self.out.write(prefix)
+            write_file_as_data_uri(self.out, f, f.name)
+            self.out.write(suffix)
+        return True
+
+    # --- eventos do HTMLParser ---
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "link":
+            self._trocado = self._css(dict(attrs))
+        elif tag == "script":
+            a = dict(attrs)
+            self._trocado = self._counts(a) or ("src" in a and self._js(a))
+            self._pulando = self._trocado
+        elif tag == "img" and self.inline_images:
+            self._trocado = self._img(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if self._pulando and tag == "script":
+            self._pulando = False
+            self._trocado = True
+        elif tag == "body" and self.counts and not self._counts_gravado:
+            # o próprio </body> sai do original, logo depois
+            self.out.write(self.counts + "\n")
+            self._counts_gravado = True
+
+    def updatepos(self, i, j):
+        # [i, j) de self.rawdata = trecho do evento que acabou de ser tratado
+        if i < j and not (self._trocado or self._pulando):
+            self.out.write(self.rawdata[i:j])
+        self._trocado = False
+        return super().updatepos(i, j)
+
+    def close(self):
+        super().close()
+        # o HTMLParser não devolve o resto de um <script>/<style> sem fechamento
+        if self.rawdata and not self._pulando:
+            self.out.write(self.rawdata)
+        if self.counts and not self._counts_gravado:
+            self.out.write("\n" + self.counts)
+            self._counts_gravado = True
+
+
+def empacotar(
+    html_path: Path, out_path: Path, counts_path=None, inline_images=False
+):
+    """
+    Lê o HTML em blocos e grava o bundle conforme avança, num temporário ao
+    lado de out_path: o out_path só é trocado (os.replace) se tudo deu certo,
+    então um CSS faltando não deixa um bundle pela metade no lugar do bom.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        entrada = html_path.open(encoding="utf-8")
+    except Exception as e:
+        raise SystemExit(f"Erro lendo {html_path}: {e}")
+    # mesmo diretório (os.replace atômico) e permissões normais do umask
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    try:
+        with entrada, tmp.open("w", encoding="utf-8") as out:
+            p = Empacotador(out, html_path.parent, counts_path, inline_images)
+            for bloco in iter(lambda: entrada.read(TAMANHO_BLOCO), ""):
+                p.feed(bloco)
+            p.close()
+        os.replace(tmp, out_path)
+    except BaseException:
+        # SystemExit (read_text) também: o temporário não fica para trás
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def main():
@@ -140,25 +213,13 @@ def main():
     )
     args = p.parse_args()
 
-    html_path: Path = args.html.resolve()
-    html_dir = html_path.parent
-    html = read_text(html_path)
-
-    # 1) CSS local inline
-    html = inline_css(html, html_dir)
-    # 2) JS local inline
-    html = inline_js(html, html_dir)
-    # 3) counts.json inline (se fornecido)
-    if args.json:
-        counts_path = args.json.resolve()
-        html = inline_counts_json(html, counts_path)
-    # 4) imagens locais inline (opcional)
-    if args.inline_images:
-        html = inline_images(html, html_dir)
-
-    # 5) saída
-    args.out.parent.mkdir(parents=True, exist_ok=True)
-    args.out.write_text(html, encoding="utf-8")
+    # CSS, JS, counts.json (se fornecido) e imagens (opcional) numa passada
+    empacotar(
+        args.html.resolve(),
+        args.out,
+        args.json.resolve() if args.json else None,
+        args.inline_images,
+    )
     print(f"✅ Gerado: {args.out}")
 
 
@@ -0,0 +1,110 @@
+"""
+Histórico append-only do progresso por skill (data/historico.sqlite).
+
+Cada gravação de progresso (progresso_store.ProgressoStore.gravar) acrescenta
+uma linha por skill com o instante da varredura; nada é sobrescrito, então
+dá para montar gráficos de tendência sem revarrer snapshots antigos.
+As consultas usam o índice (skill, ts) e devolvem as linhas em streaming.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+HISTORICO_DB = BASE_DIR / "data" / "historico.sqlite"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS historico (
+    id INTEGER PRIMARY KEY,
+    skill TEXT NOT NULL,
+    ts INTEGER NOT NULL,            -- epoch em milissegundos (UTC)
+    projects INTEGER,
+    missing INTEGER,
+    percent INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_historico_skill_ts ON historico (skill, ts);
+CREATE TRIGGER IF NOT EXISTS historico_sem_update
+BEFORE UPDATE ON historico
+BEGIN
+    SELECT RAISE(ABORT, 'historico é append-only');
+END;
+CREATE TRIGGER IF NOT EXISTS historico_sem_delete
+BEFORE DELETE ON historico
+BEGIN
+    SELECT RAISE(ABORT, 'historico é append-only');
+END;
+"""
+
+
+def _conectar(caminho: Path) -> sqlite3.Connection:
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(caminho))
+    conn.executescript(_ESQUEMA)
+    return conn
+
+
+def _para_ms(quando: datetime) -> int:
+    if quando.tzinfo is None:
+        quando = quando.astimezone()
+    return int(quando.timestamp() * 1000)
+
+
+def _de_ms(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def registrar(linhas: dict, quando: datetime = None, caminho: Path = HISTORICO_DB):
+    """
+    Acrescenta uma linha por skill: linhas = { skill: {'projects','missing','percent'} }
+    (mesmo formato de progresso_store.linhas_progresso). Todas recebem o mesmo ts.
+    """
+    ts = _para_ms(quando or datetime.now(timezone.utc))
+    conn = _conectar(caminho)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO historico (skill, ts, projects, missing, percent)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    (s, ts, v.get("projects"), v.get("missing"), v.get("percent"))
+                    for s, v in linhas.items()
+                ),
+            )
+    finally:
+        conn.close()
+
+
+def serie(
+    skill: str,
+    desde: datetime = None,
+    ate: datetime = None,
+    limite: int = None,
+    caminho: Path = HISTORICO_DB,
+):
+    """
+    Gera (quando, projects, missing, percent) de `skill` em ordem cronológica,
+    opcionalmente entre `desde` e `ate` (inclusive). Lê direto do cursor,
+    sem carregar a tabela na memória.
+    """
+    if not caminho.exists():
+        return
+    sql = "SELECT ts, projects, missing, percent FROM historico WHERE skill = ?"
+    params = [skill.strip().lower()]
+    if desde is not None:
+        sql += " AND ts >= ?"
+        params.append(_para_ms(desde))
+    if ate is not None:
+        sql += " AND ts <= ?"
+        params.append(_para_ms(ate))
+    sql += " ORDER BY ts"
+    if limite is not None:
+        sql += " LIMIT ?"
+        params.append(int(limite))
+
+    conn = _conectar(caminho)
+    try:
+        for ts, projects, missing, percent in conn.execute(sql, params):
+            yield _de_ms(ts), projects, missing, percent
+    finally:
+        conn.close()
@@ -1,16 +1,13 @@
 import os, sys
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
     QGraphicsOpacityEffect,
     QStackedWidget,
-    QFrame,
-    QLabel,
     QGridLayout,
-    QPushButton,
-    QSizePolicy,
-    QLayout,
 )
 from PySide6.QtCore import (
     Qt,
@@ -21,7 +18,6 @@ from PySide6.QtCore import (
     QParallelAnimationGroup,
     QPauseAnimation,
     QAbstractAnimation,
-    QPoint,
 )
 from PySide6.QtGui import QShortcut, QKeySequence, QDesktopServices, QColor
 from PySide6.QtCore import (
@@ -33,50 +29,27 @@ from PySide6.QtCore import (
     QParallelAnimationGroup,
     QPauseAnimation,
     QAbstractAnimation,
-    QPoint,
     QUrl,
+    QThreadPool,
 )
 
 from Screen import Ui_Dialog
 from PySide6.QtWidgets import QMessageBox, QGraphicsDropShadowEffect
-from ui_loader import carregar_ui
-from SkillExcel import atualizar_planilha_por_projetos, calcular_progressos
+from ui_loader import carregar_ui, pre_carregar
+from projetos_index import SkillScan, calcular_progressos, escanear, escanear_skill
+from tarefas import AtualizacaoStartup
+from observador import ObservadorProjetos
+from projetos_grid import CardDelegate, ProjetosGrid
+from projetos_model import ProjectListModel
+from tema import COR_PADRAO, CORES_SKILLS, paleta
+from pixmaps import carregar_painel
 
 # Base do projeto, independente de onde você rodar
 BASE_DIR = Path(__file__).resolve().parent
-MAX_PROJETOS_POR_SKILL = 50
 
-
-def skill_to_folder(skill: str) -> Path:
-    # mesma convenção que você já usa no preencher_grid_projetos: "Excel", "Powerbi", etc.
-    cap = (skill or "").strip()
-    if not cap:
-        return BASE_DIR / "Projetos" / cap
-    return BASE_DIR / "Projetos" / (cap[:1].upper() + cap[1:].lower())
-
-
-def contar_projetos(skill: str) -> int:
-    """Conta subpastas imediatas em Projetos/<SkillCap>."""
-    pasta = skill_to_folder(skill)
-    if not pasta.exists():
-        return 0
-    try:
-        return sum(1 for p in pasta.iterdir() if p.is_dir())
-    except Exception:
-        return 0
-
-
-def calcular_progressos(skills: list[str]) -> dict:
-    """
-    Retorna: { skill: {'count':int, 'faltam':int, 'percent':int} }
-    """
-    out = {}
-    for s in skills:
-        c = contar_projetos(s)
-        faltam = max(0, MAX_PROJETOS_POR_SKILL - c)
-        percent = min(100, round((c / MAX_PROJETOS_POR_SKILL) * 100))
-        out[s] = {"count": c, "faltam": faltam, "percent": percent}
-    return out
+# Quantas telas ficam montadas no QStackedWidget (LRU). Cabe uma volta
+# completa do btnProx pelas 9 skills; acima disso a menos usada sai.
+MAX_TELAS_CACHE = 9
 
 
 def abspath(*parts: str) -> str:
@@ -92,81 +65,11 @@ def abrir_pasta(p: Path, parent=None):
     QDesktopServices.openUrl(QUrl.fromLocalFile(str(p)))
 
 
-def _hex_to_rgb(hx: str):
-    hx = hx.strip().lstrip("#")
-    if len(hx) == 3:
-        hx = "".join(c * 2 for c in hx)
-    r = int(hx[0:2], 16)
-    g = int(hx[2:4], 16)
-    b = int(hx[4:6], 16)
-    return r, g, b
-
-
-def _rgb_to_hex(r: int, g: int, b: int) -> str:
-    return "#{:02x}{:02x}{:02x}".format(
-        max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))
-    )
-
-
-def _blend(rgb, factor: float, to_white=True):
-    """factor 0..1: aproxima de branco (to_white=True) ou preto (False)."""
-    r, g, b = rgb
-    if to_white:
-        return (
-            int(r + (255 - r) * factor),
-            int(g + (255 - g) * factor),
-            int(b + (255 - b) * factor),
-        )
-    else:
-        return (int(r * (1 - factor)), int(g * (1 - factor)), int(b * (1 - factor)))
-
-
-def _auto_text_color(rgb) -> str:
-    # luminância relativa aproximada -> escolhe preto ou branco
-    r, g, b = [c / 255 for c in rgb]
-    lum = 0.2126 * r + 0.7152 * g + 0.0722 * b
-    return "#000000" if lum > 0.6 else "#ffffff"
-
-
-def make_button_qss(base_hex: str) -> str:
-    base_rgb = _hex_to_rgb(base_hex)
-    text_hex = _auto_text_color(base_rgb)
-    hover_rgb = _blend(base_rgb, 0.18, to_white=True)  # 18% mais claro
-    press_rgb = _blend(base_rgb, 0.18, to_white=False)  # 18% mais escuro
-    hover_hex = _rgb_to_hex(*hover_rgb)
-    press_hex = _rgb_to_hex(*press_rgb)
-    focus_hex = hover_hex
-
-    return f"""
-        QPushButton {{
-            background-color: {base_hex};
-            color: {text_hex};
-            border: 1px solid transparent;
-            border-radius: 6px;
-            padding: 6px 12px;
-            font-weight: 600;
-        }}
-        QPushButton:hover {{
-            background-color: {hover_hex};
-            color: {text_hex};
-            border: 1px solid {focus_hex};
-        }}
-        QPushButton:focus {{
-            border: 2px solid {focus_hex};
-        }}
-        QPushButton:pressed {{
-            background-color: {press_hex};
-            color: {text_hex};
-        }}
-        QPushButton:disabled {{
-            background-color: #555;
-            color: #bbb;
-            border: 1px solid #555;
-        }}
-    """
-
-
+# Os geradores de QSS abaixo partem da Paleta (tema.py) e são memorizados
+# pela cor: cada skill monta (e o Qt interpreta) o mesmo texto uma vez só.
+@lru_cache(maxsize=None)
 def make_scrollbar_qss(color_hex: str) -> str:
+    hover_hex = paleta(color_hex).scrollbar_hover
     return f"""
         QScrollBar:vertical {{
            background: #111;
@@ -180,7 +83,7 @@ def make_scrollbar_qss(color_hex: str) -> str:
            min-height: 30px;
         }}
         QScrollBar::handle:vertical:hover {{
-        background: {_rgb_to_hex(*_blend(_hex_to_rgb(color_hex), 0.25, True))};
+        background: {hover_hex};
         }}
         QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
             background: none;
@@ -198,14 +101,19 @@ def make_scrollbar_qss(color_hex: str) -> str:
             min-width: 30px;
         }}
         QScrollBar::handle:horizontal:hover {{
-            background: {_rgb_to_hex(*_blend(_hex_to_rgb(color_hex), 0.25, True))};
+            background: {hover_hex};
         }}
         """
 
 
-def make_menu_button_qss(color_hex: str) -> str:
-    rgb = _hex_to_rgb(color_hex)
-    text_hex = _auto_text_color(rgb)
+@lru_cache(maxsize=None)
+def make_menu_button_qss(color_hex: str, seletor: str = "QPushButton") -> str:
+    """
+    seletor: a quem as regras se aplicam; com "QPushButton#btnexcel" o texto
+    pode ir junto com o dos outros botões numa única folha no container.
+    """
+    p = paleta(color_hex)
+    rgb, text_hex = p.rgb, p.text
 
     hover_rgba = f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, 0.18)"  # leve brilho no hover
     focus_rgba = f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, 0.35)"  # cor aparece ao focar
@@ -213,7 +121,7 @@ def make_menu_button_qss(color_hex: str) -> str:
 
     return f"""
         /* Estado normal: invisível (transparente) */
-        QPushButton {{
+        {seletor} {{
             background-color: transparent;
             color: rgba(255, 255, 255, 0.8);  /* texto branco semi-transparente */
             border: 2px solid transparent;    /* sem borda */
@@ -223,28 +131,28 @@ def make_menu_button_qss(color_hex: str) -> str:
         }}
 
         /* Hover: brilho leve da cor */
-        QPushButton:hover {{
+        {seletor}:hover {{
             background-color: {hover_rgba};
             color: {text_hex};
             border: 2px solid transparent;
         }}
 
         /* Foco: cor da skill aparece */
-        QPushButton:focus {{
+        {seletor}:focus {{
             background-color: {focus_rgba};
             color: {text_hex};
             border: 2px solid {color_hex};
         }}
 
         /* Pressionado: mais intenso */
-        QPushButton:pressed {{
+        {seletor}:pressed {{
             background-color: {pressed_rgba};
             color: {text_hex};
             border: 2px solid {color_hex};
         }}
 
         /* Desativado */
-        QPushButton:disabled {{
+        {seletor}:disabled {{
             background-color: transparent;
             color: rgba(180,180,180,0.4);
             border: 2px solid transparent;
@@ -271,170 +179,75 @@ def scroll_suave(scrollArea, destino, duracao=600):
 def preencher_grid_projetos(
     tela,
     skill: str,
-    btn_hex: str = "#00b894",
-    atraso_entre_cards_ms=10,
+    btn_hex: str = COR_PADRAO,
+    atraso_entre_cards_ms=40,
     dur_ms=200,
     desloc_px=14,
+    scan: SkillScan = None,
+    animar: bool = True,
 ):
-    from pathlib import Path
-
-    skill_cap = skill[:1].upper() + skill[1:].lower()
-    pasta = Path(BASE_DIR, "Projetos", skill_cap)
-    if not pasta.exists():
+    """
+    Mostra os projetos de `scan` no grid da tela. Com animar=False (refresh
+    do observador) o modelo existente é atualizado no lugar: a rolagem fica
+    e só os cards novos/removidos mudam.
+    """
+    if scan is None:
+        scan = escanear_skill(skill)
+    pasta = scan.pasta
+    if not scan.existe:
         print(f"[ERRO] Pasta não encontrada: {pasta}")
         QMessageBox.critical(
             tela, "Pasta não encontrada", f"Não achei a pasta:\n{pasta}"
         )
         return
 
-    tela.scrollArea.setWidgetResizable(True)
-    scroll_widget = tela.scrollAreaWidgetContents
-
-    # limpa conteúdo anterior
-    old = scroll_widget.layout()
-    if old:
-        while old.count():
-            it = old.takeAt(0)
-            w = it.widget()
-            if w:
-                w.deleteLater()
-        old.deleteLater()
-
-    # parâmetros visuais
-    CARD_W, CARD_H = 206, 110
-    H_SP, V_SP = 20, 24
-    M_LEFT, M_TOP, M_RIGHT, M_BOTTOM = 24, 24, 24, 24
-
-    grid = QGridLayout(scroll_widget)
-    grid.setContentsMargins(M_LEFT, M_TOP, M_RIGHT, M_BOTTOM)
-    grid.setHorizontalSpacing(H_SP)
-    grid.setVerticalSpacing(V_SP)
-    grid.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-    grid.setSizeConstraint(QLayout.SetMinimumSize)
-
-    subpastas = sorted([n.name for n in pasta.iterdir() if n.is_dir()])
-    slots, cards = [], []
-
-    if hasattr(tela, "_anim_refs"):
-        for grp in tela._anim_refs:
-            try:
-                grp.stop()
-            except Exception:
-                pass
-        tela._anim_refs.clear()
+    grid = getattr(tela, "_grid_projetos", None)
+    if grid is None:
+        tela.scrollArea.setWidgetResizable(True)
+        # o grid virtualizado rola sozinho; a scrollArea do .ui só o hospeda
+        tela.scrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll_widget = tela.scrollAreaWidgetContents
+        antigo = getattr(tela, "gridLayoutWidget", None)
+        if antigo is not None:
+            antigo.hide()
+            antigo.deleteLater()
+
+        grid = ProjetosGrid(scroll_widget)
+        lay = QGridLayout(scroll_widget)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.addWidget(grid)
+        grid.abrirProjeto.connect(lambda p: abrir_pasta(Path(p), tela))
+        tela._grid_projetos = grid
+
+    p = paleta(btn_hex)
+    cores = {"base": p.base, "hover": p.hover, "pressed": p.pressed, "text": p.text}
+    if isinstance(grid.itemDelegate(), CardDelegate):
+        # o mesmo delegate serve a todos os refills (o Qt não apaga o anterior)
+        grid.itemDelegate().definir_cores(cores)
     else:
-        tela._anim_refs = []
-
-    for nome in subpastas:
-        slot = QFrame(scroll_widget)
-        slot.setFixedSize(CARD_W, CARD_H)
-        slot.setStyleSheet("background: transparent;")
-
-        card = QFrame(slot)
-        card.setObjectName("cardProjeto")
-        card.setGeometry(0, desloc_px, CARD_W, CARD_H)
-        card.setStyleSheet(
-            f"""
-            QFrame#cardProjeto {{
-                background-color: rgba(40, 40, 40, 0.75);
-                border: 1px solid #555;
-        border-radius: 10px;
-            }}
-            QFrame#cardProjeto:hover {{
-                border: 2px solid {btn_hex};
-                background-color: rgba(60, 60, 60, 0.9);
-            }}
-        """
-        )
-
-        label = QLabel(nome, card)
-        label.setAlignment(Qt.AlignCenter)
-        label.setWordWrap(True)
-        label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        label.setStyleSheet(
-            """
-            color: white;
-            font-size: 13px;
-            font-weight: bold;
-            padding: 2px;
-        """
-        )
-        label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-
-        botao = QPushButton("Abrir", card)
-        botao.setCursor(Qt.PointingHandCursor)
-        botao.setStyleSheet(make_button_qss(btn_hex))  # <— usa a cor da skill
-        botao.setFocusPolicy(Qt.StrongFocus)  # necessário pro :focus
-        botao.setStyleSheet(make_button_qss(btn_hex))
-
-        # caminho da subpasta daquele card
-        caminho_subpasta = pasta / nome
-        botao.clicked.connect(lambda _, p=caminho_subpasta: abrir_pasta(p, tela))
-
-        lay = QGridLayout(card)
-        lay.setContentsMargins(8, 8, 8, 8)
-        lay.addWidget(label, 0, 0, Qt.AlignCenter)
-        lay.addWidget(botao, 1, 0, Qt.AlignCenter)
-
-        eff = QGraphicsOpacityEffect(card)
-        eff.setOpacity(0.0)
-        card.setGraphicsEffect(eff)
-
-        slots.append(slot)
-        cards.append(card)
-
-    # === Recalcula colunas conforme tamanho da janela ===
-    def relayout():
-        avail = tela.scrollArea.viewport().width() - (M_LEFT + M_RIGHT)
-        colunas = max(1, (avail + H_SP) // (CARD_W + H_SP))
-        while grid.count():
-            grid.takeAt(0)
-        for i, slot in enumerate(slots):
-            grid.addWidget(slot, i // colunas, i % colunas)
-        rows = (len(slots) + colunas - 1) // colunas
-        total_h = (rows * CARD_H) + max(0, rows - 1) * V_SP + M_TOP + M_BOTTOM
-        scroll_widget.setMinimumHeight(total_h)
-
-    relayout()
-
-    old_resize = tela.scrollArea.resizeEvent
-
-    def on_resize(ev):
-        relayout()
-        if old_resize:
-            old_resize(ev)
-
-    tela.scrollArea.resizeEvent = on_resize
-
-    # animação
-    def animar(i=0):
-        if i >= len(cards):
-            return
-        c = cards[i]
-        eff = c.graphicsEffect()
-        fade = QPropertyAnimation(eff, b"opacity", tela)
-        fade.setDuration(dur_ms)
-        fade.setStartValue(0.0)
-        fade.setEndValue(1.0)
-        fade.setEasingCurve(QEasingCurve.OutCubic)
-
-        slide = QPropertyAnimation(c, b"pos", tela)
-        slide.setDuration(dur_ms)
-        slide.setStartValue(QPoint(0, desloc_px))
-        slide.setEndValue(QPoint(0, 0))
-        slide.setEasingCurve(QEasingCurve.OutCubic)
-
-        grp = QParallelAnimationGroup(tela)
-        grp.addAnimation(fade)
-        grp.addAnimation(slide)
-        tela._anim_refs.append(grp)
-        grp.finished.connect(
-            lambda: QTimer.singleShot(atraso_entre_cards_ms, lambda: animar(i + 1))
-        )
-        grp.start()
+        grid.setItemDelegate(CardDelegate(grid, cores))
+    modelo_antigo = grid.model()
+    if (
+        not animar
+        and isinstance(modelo_antigo, ProjectListModel)
+        and modelo_antigo.pasta == Path(scan.pasta)
+    ):
+        grid.encerrar_animacao()
+        modelo_antigo.atualizar(scan)
+        tela._scan_projetos = scan
+        print(f"[OK] Grid de {skill} atualizado ({scan.count} projetos).")
+        return
+    grid.setModel(ProjectListModel(scan, parent=grid))
+    if modelo_antigo is not None:
+        modelo_antigo.deleteLater()
+    # linhas do primeiro lote (o resto chega pelo fetchMore, já visível)
+    n = grid.model().rowCount()
 
-    QTimer.singleShot(120, lambda: animar(0))
-    print(f"[OK] {len(subpastas)} projetos carregados e animados.")
+    # cascata: cada card visível aparece (fade + sobe desloc_px)
+    # atraso_entre_cards_ms depois do anterior
+    grid.animar_entrada(atraso_entre_cards_ms, dur_ms, desloc_px)
+    tela._scan_projetos = scan
+    print(f"[OK] {n} projetos carregados e animados.")
 
 
 # ==============================================================
@@ -450,17 +263,8 @@ class MainWindow(QDialog):
         self.setFixedSize(self.size())
         self.setWindowTitle("Portfólio")
         # ===== Cores / skills =====
-        self.skill_btn_colors = {
-            "excel": "#00ff62",
-            "powerbi": "#f2c811",
-            "vba": "#9000f0",
-            "sql": "#00a2ff",
-            "java": "#ff0000",
-            "python": "#f2c811",
-            "ia": "#9000f0",
-            "redes": "#00a2ff",
-            "process": "#ff0000",
-        }
+        # cores-base e paletas derivadas vêm do tema.py (compartilhado com o WEB/)
+        self.skill_btn_colors = dict(CORES_SKILLS)
         self.skills = [
             "excel",
             "powerbi",
@@ -498,27 +302,17 @@ class MainWindow(QDialog):
             "process",  # aqui você decide a ordem visual
         ]
 
-        try:
-            from SkillExcel import atualizar_planilha_por_projetos, calcular_progressos
-        except ImportError:
-            print(
-                "[AVISO] Não encontrei planilha_utils.py, pulando atualização automática."
-            )
-        else:
-            # Atualiza a planilha (grava colunas projects/missing/percent)
-            atualizar_planilha_por_projetos(
-                self.skills, sobrescrever_value_com_percent=True
-            )
-
-            # Atualiza as barras do menu inicial, se existirem
-            progresso = calcular_progressos(self.skills)
-            for skill, info in progresso.items():
-                barra = getattr(self.ui, skill, None)
-                if barra and hasattr(barra, "setValue"):
-                    try:
-                        barra.setValue(info["percent"])
-                    except Exception:
-                        pass
+        # Varredura de Projetos/ + planilha rodam em segundo plano; até os
+        # dados chegarem as barras ficam zeradas (a intro anima quando chegar)
+        self.index = None
+        # eventos do observador que chegam antes da varredura inicial
+        self._scans_pendentes = {}
+        self._fill_anims = {}
+        self._anim_barras = {}
+        for skill in self.skills:
+            barra = getattr(self.ui, skill, None)
+            if barra and hasattr(barra, "setValue"):
+                barra.setValue(0)
         # ===== Container principal =====
         self.container = QStackedWidget(self)
         layout_principal = QGridLayout(self)
@@ -529,6 +323,9 @@ class MainWindow(QDialog):
         if hasattr(self.ui, "framePrincipal"):
             self.container.addWidget(self.ui.framePrincipal)
 
+        # caminho normalizado do .ui -> tela já montada (mais recente no fim)
+        self._cache_telas = OrderedDict()
+
         # ===== Atalhos =====
         QShortcut(QKeySequence("F11"), self, activated=self.toggle_fullscreen)
         QShortcut(QKeySequence("Ctrl+M"), self, activated=self.showMinimized)
@@ -541,20 +338,31 @@ class MainWindow(QDialog):
         self._build_intro_sequence()
 
         # ===== Liga botões do menu às telas específicas (se quiser abrir direto) =====
+        qss_menu = []
         for s in self.skills:
             btn = getattr(self.ui, f"btn{s}", None)
             if btn:
                 ui_path = abspath("telas", f"{s}.ui")
                 btn.clicked.connect(lambda _, p=ui_path: self.abrir_tela(p))
 
-                cor = self.skill_btn_colors.get(s, "#00b894")
-                btn.setStyleSheet(make_menu_button_qss(cor))
+                cor = self.skill_btn_colors.get(s, COR_PADRAO)
+                qss_menu.append(
+                    make_menu_button_qss(cor, f"QPushButton#{btn.objectName()}")
+                )
+                # a folha própria do botão (Screen.py) teria prioridade sobre a
+                # do container e esconderia hover/pressed da skill
+                btn.setStyleSheet("")
                 btn.setAutoDefault(False)
                 btn.setDefault(False)
                 btn.setCheckable(False)
                 btn.setDown(False)
                 btn.setFocusPolicy(Qt.NoFocus)
                 btn.clearFocus()
+        # uma folha só no container (seletores por objectName) em vez de uma
+        # por botão
+        if qss_menu:
+            menu = getattr(self.ui, "framePrincipal", self)
+            menu.setStyleSheet(menu.styleSheet() + "".join(qss_menu))
 
         # ===== Navegação sequencial por .ui (TELAS/telas) =====
         self._telas_dir = next(
@@ -569,11 +377,33 @@ class MainWindow(QDialog):
             )
         else:
             self._indexar_telas()
+            # lê os .ui (ou importa os compilados) assim que a janela ficar ociosa
+            QTimer.singleShot(0, lambda: pre_carregar(self._telas))
+            # e já monta a tela 0, destino do primeiro btnProx do menu
+            QTimer.singleShot(0, self._preaquecer_proxima)
         # btnProx no menu principal (se existir)
         btnProx_menu = getattr(self.ui, "btnProx", None)
         if btnProx_menu:
             btnProx_menu.clicked.connect(self.next_tela)
 
+        # ===== Atualização inicial (fora da thread da GUI) =====
+        self._job_startup = AtualizacaoStartup(
+            self.skills, sobrescrever_value_com_percent=True
+        )
+        self._job_startup.sinais.indexado.connect(self._aplicar_index)
+        self._job_startup.sinais.falhou.connect(
+            lambda msg: print(f"[AVISO] {msg}")
+        )
+        self._job_startup.sinais.concluido.connect(
+            lambda: print("[OK] Atualização inicial concluída.")
+        )
+        QThreadPool.globalInstance().start(self._job_startup)
+
+        # ===== Observa Projetos/<Skill> e atualiza só a skill alterada =====
+        self._tela_skill = None  # (skill, tela) da tela de skill aberta
+        self._observador = ObservadorProjetos(self.skills, parent=self)
+        self._observador.skillAtualizada.connect(self._on_skill_atualizada)
+
     # === Helpers de animação (iguais aos seus) ===
     def _collect_intro_targets(self):
         if hasattr(self, "_paineis"):
@@ -627,12 +457,34 @@ class MainWindow(QDialog):
             except Exception:
                 pass
 
+        # os efeitos podem ter sido recriados: reaponta os fades da intro
+        for fade, w in getattr(self, "_intro_fades", []):
+            fade.setTargetObject(w.graphicsEffect())
+
+    def _mostrar_painel(self, painel, estado):
+        if estado == QAbstractAnimation.Running:
+            carregar_painel(painel)
+
+    def _remover_efeitos_intro(self):
+        """
+        Fim da intro: tudo com opacidade 1.0. Sem o QGraphicsOpacityEffect o
+        widget volta a ser pintado direto (o efeito força renderização fora
+        da tela a cada repaint). _reset_intro_widgets os recria no voltar().
+        """
+        for w in self._paineis + self._btns + self._barras:
+            if isinstance(w.graphicsEffect(), QGraphicsOpacityEffect):
+                w.setGraphicsEffect(None)
+        for p in self._paineis:
+            carregar_painel(p)
+
     def _build_intro_sequence(self):
         if self.intro_built:
             return
         self._collect_intro_targets()
         self._reset_intro_widgets()
         self.anim_seq = QSequentialAnimationGroup(self)
+        self.anim_seq.finished.connect(self._remover_efeitos_intro)
+        self._intro_fades = []
         total = max(len(self._paineis), len(self._btns), len(self._barras))
 
         def _fade_for_if_opacity(w):
@@ -644,6 +496,7 @@ class MainWindow(QDialog):
             fade.setStartValue(0.0)
             fade.setEndValue(1.0)
             fade.setEasingCurve(QEasingCurve.OutCubic)
+            self._intro_fades.append((fade, w))
             return fade
 
         for i in range(total):
@@ -657,6 +510,11 @@ class MainWindow(QDialog):
                 fade = _fade_for_if_opacity(target)
                 if fade:
                     group.addAnimation(fade)
+            if p:
+                # a imagem do painel só é decodificada quando o fade dele começa
+                group.stateChanged.connect(
+                    lambda novo, _antigo, p=p: self._mostrar_painel(p, novo)
+                )
 
             if br and hasattr(br, "value"):
                 key = None
@@ -670,6 +528,8 @@ class MainWindow(QDialog):
                 fill.setEndValue(self._barras_final.get(key, 0))
                 fill.setEasingCurve(QEasingCurve.InOutCubic)
                 group.addAnimation(fill)
+                if key:
+                    self._fill_anims[key] = fill
 
             if group.animationCount():
                 self.anim_seq.addAnimation(group)
@@ -733,16 +593,21 @@ class MainWindow(QDialog):
             )
             return
 
-        try:
-            nova_tela = carregar_ui(caminho_ui)
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Erro ao carregar UI", f"{e}\n\nCaminho: {caminho_ui}"
-            )
-            return
+        chave = os.path.normcase(os.path.abspath(caminho_ui))
+        nova_tela = self._cache_telas.get(chave)
+        if nova_tela is not None:
+            self._cache_telas.move_to_end(chave)
+        else:
+            try:
+                nova_tela = self._montar_tela(caminho_ui)
+            except Exception as e:
+                QMessageBox.critical(
+                    self, "Erro ao carregar UI", f"{e}\n\nCaminho: {caminho_ui}"
+                )
+                return
 
-        self.container.addWidget(nova_tela)
         self.container.setCurrentWidget(nova_tela)
+        self._podar_cache_telas()
 
         # Atualiza o índice se a abertura foi direta
         try:
@@ -755,27 +620,77 @@ class MainWindow(QDialog):
         except Exception:
             pass
 
-        # Voltar / Próximo embutidos na tela, se existirem
+        # Detecção de skill para preencher grid (se for tela de skill)
+        stem = Path(caminho_ui).stem.lower()
+        if stem in self.skills:
+            cor = self.skill_btn_colors.get(stem, COR_PADRAO)
+            scan = self.index[stem] if self.index and stem in self.index else None
+            if scan is not None and scan.expirado and not scan.existe:
+                scan = None  # estourou o timeout sem cache: lista agora
+            anterior = getattr(nova_tela, "_scan_projetos", None)
+            # tela reaproveitada: só refaz o grid se a pasta mudou
+            if (
+                scan is None
+                or anterior is None
+                or (scan.pasta, scan.pastas) != (anterior.pasta, anterior.pastas)
+            ):
+                preencher_grid_projetos(nova_tela, stem, btn_hex=cor, scan=scan)
+            self._tela_skill = (stem, nova_tela)
+        else:
+            self._tela_skill = None
+
+        # monta a próxima do btnProx enquanto o usuário olha esta
+        QTimer.singleShot(0, self._preaquecer_proxima)
+
+    def _montar_tela(self, caminho_ui: str):
+        """Carrega o .ui, liga Voltar/Próximo e guarda no cache (sem exibir)."""
+        nova_tela = carregar_ui(caminho_ui)
+        self.container.addWidget(nova_tela)
+        self._cache_telas[os.path.normcase(os.path.abspath(caminho_ui))] = nova_tela
+
+        # Voltar / Próximo embutidos na tela, se existirem (tela nova: sem
+        # conexões anteriores para desfazer)
         if hasattr(nova_tela, "btnVoltar"):
-            try:
-                nova_tela.btnVoltar.clicked.disconnect()
-            except Exception:
-                pass
             nova_tela.btnVoltar.clicked.connect(self.voltar)
 
         if hasattr(nova_tela, "btnProx"):
-            try:
-                nova_tela.btnProx.clicked.disconnect()
-            except Exception:
-                pass
             nova_tela.btnProx.clicked.connect(self.next_tela)
 
-        # Detecção de skill para preencher grid (se for tela de skill)
         stem = Path(caminho_ui).stem.lower()
         if stem in self.skills:
-            cor = self.skill_btn_colors.get(stem, "#00b894")
-            preencher_grid_projetos(nova_tela, stem, btn_hex=cor)
+            cor = self.skill_btn_colors.get(stem, COR_PADRAO)
             nova_tela.setStyleSheet(nova_tela.styleSheet() + make_scrollbar_qss(cor))
+        return nova_tela
+
+    def _preaquecer_proxima(self):
+        if not self._telas:
+            return
+        # no menu o índice é -1: a próxima é a tela 0
+        proxima = self._telas[(self._current_tela_idx + 1) % len(self._telas)]
+        if os.path.normcase(os.path.abspath(proxima)) in self._cache_telas:
+            return
+        try:
+            self._montar_tela(proxima)
+        except Exception as e:
+            # na hora do clique o abrir_tela mostra o erro
+            print(f"[AVISO] Não consegui pré-carregar {proxima}: {e}")
+            return
+        self._podar_cache_telas()
+
+    def _podar_cache_telas(self):
+        """Descarta as telas menos usadas além de MAX_TELAS_CACHE."""
+        while len(self._cache_telas) > MAX_TELAS_CACHE:
+            chave, tela = next(iter(self._cache_telas.items()))
+            if tela is self.container.currentWidget():
+                self._cache_telas.move_to_end(chave)
+                continue
+            del self._cache_telas[chave]
+            grid = getattr(tela, "_grid_projetos", None)
+            if grid is not None:
+                grid.parar_animacao()
+            self.container.removeWidget(tela)
+            tela.deleteLater()
+            print(f"[DEBUG] Tela descartada do cache: {chave}")
 
     def next_tela(self):
         if not self._telas:
@@ -789,6 +704,7 @@ class MainWindow(QDialog):
     def voltar(self):
         print("[DEBUG] Voltou ao menu principal")
         self.container.setCurrentWidget(self.ui.framePrincipal)
+        self._tela_skill = None
         self.intro_started = False
         self._reset_intro_widgets()
         if not self.anim_seq:
@@ -803,20 +719,96 @@ class MainWindow(QDialog):
         """
         if not hasattr(self, "skills"):
             return
-        prog = calcular_progressos(self.skills)
+        self._aplicar_index(escanear(self.skills))
+
+    def _aplicar_index(self, index):
+        """Recebe o ProjetosIndex (da tarefa de startup ou de um refresh)."""
+        self.index = index
+        prog = calcular_progressos(self.skills, index)
         for s, info in prog.items():
-            barra = getattr(self.ui, s, None)  # você já usa esse padrão
-            if barra and hasattr(barra, "setValue"):
-                try:
-                    barra.setValue(int(info["percent"]))
-                except Exception:
-                    pass
+            self._animar_barra(s, int(info["percent"]))
+        # recontagens que chegaram antes: a varredura pode ter lido a pasta
+        # antes da mudança que as disparou
+        pendentes, self._scans_pendentes = self._scans_pendentes, {}
+        for s, scan in pendentes.items():
+            self._on_skill_atualizada(s, scan)
+
+    def _on_skill_atualizada(self, skill: str, scan):
+        """Uma pasta Projetos/<Skill> mudou: barra e grid aberto (se for dela)."""
+        if scan.expirado:
+            # listagem não voltou a tempo: mantém barra e grid como estão
+            print(f"[AVISO] Recontagem de {skill} estourou o timeout.")
+            return
+        if self.index is None:
+            # a varredura inicial ainda não voltou: aplica quando ela chegar
+            self._scans_pendentes[skill] = scan
+            return
+        self.index = self.index.com(scan)
+        self._animar_barra(skill, scan.percent)
+
+        if self._tela_skill and self._tela_skill[0] == skill:
+            tela = self._tela_skill[1]
+            if self.container.currentWidget() is tela:
+                cor = self.skill_btn_colors.get(skill, COR_PADRAO)
+                preencher_grid_projetos(
+                    tela, skill, btn_hex=cor, scan=scan, animar=False
+                )
+
+    def _animar_barra(self, skill: str, valor: int):
+        self._barras_final[skill] = valor
+        fill = self._fill_anims.get(skill)
+        if fill:
+            # a intro passa a encher a barra até o valor real
+            fill.setEndValue(valor)
+            if fill.state() == QAbstractAnimation.Running:
+                return
+            intro_pendente = not self.intro_started or (
+                self.anim_seq and self.anim_seq.state() == QAbstractAnimation.Running
+            )
+            if intro_pendente and fill.currentTime() == 0:
+                return
+
+        barra = getattr(self.ui, skill, None)  # você já usa esse padrão
+        if not (barra and hasattr(barra, "setValue")):
+            return
+        anterior = self._anim_barras.pop(skill, None)
+        if anterior:
+            anterior.stop()
+        anim = QPropertyAnimation(barra, b"value", self)
+        anim.setDuration(400)
+        anim.setStartValue(barra.value())
+        anim.setEndValue(valor)
+        anim.setEasingCurve(QEasingCurve.InOutCubic)
+        anim.start()
+        self._anim_barras[skill] = anim
+
+
+def binding_perde_none() -> bool:
+    """
+    True se o PySide6 instalado tira uma referência do None a cada chamada
+    void do Qt (PySide6 6.12.0 com Python < 3.12). O delegate do grid faz
+    dezenas dessas chamadas por repintura e o processo morre em segundos com
+    "Fatal Python error: none_dealloc". No 3.12+ o None é imortal.
+    """
+    if sys.version_info >= (3, 12):
+        return False
+    timer = QTimer()
+    antes = sys.getrefcount(None)
+    for _ in range(100):
+        timer.stop()
+    return sys.getrefcount(None) < antes - 50
 
 
 # ==============================================================
 # Execução
 # ==============================================================
 if __name__ == "__main__":
+    if binding_perde_none():
+        sys.exit(
+            "[ERRO] Este PySide6 corrompe a contagem de referências do None "
+            "com o Python < 3.12. Instale o requirements.txt "
+            "(PySide6 != 6.12.0) ou use o Python 3.12+."
+        )
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
@@ -0,0 +1,141 @@
+"""
+Observa Projetos/<Skill> e reconta só a skill que mudou.
+
+Usa QFileSystemWatcher em cada pasta de skill (notificação do SO, sem
+varrer nada). Pastas que o watcher não aceita (compartilhamentos sem
+suporte, pasta ainda inexistente) caem num polling leve: um stat() da
+própria pasta por intervalo, comparando mtime/inode — nunca a árvore toda.
+Rajadas de eventos são agrupadas (debounce) por skill antes da recontagem,
+que roda no QThreadPool.
+"""
+
+import os
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QThreadPool, QTimer, Signal
+
+from projetos_index import skill_to_folder
+from tarefas import RecontagemSkill
+
+
+def _chave(pasta: str) -> str:
+    # o watcher devolve caminhos com "/" mesmo no Windows
+    return os.path.normcase(os.path.normpath(pasta))
+
+
+class ObservadorProjetos(QObject):
+    # skill, SkillScan recém-contado
+    skillAtualizada = Signal(str, object)
+
+    def __init__(
+        self,
+        skills: list[str],
+        debounce_ms: int = 400,
+        intervalo_polling_ms: int = 5000,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.skills = list(skills)
+        self.debounce_ms = debounce_ms
+        self._pastas = {str(skill_to_folder(s)): s for s in self.skills}
+        self._por_chave = {_chave(p): s for p, s in self._pastas.items()}
+        self._timers = {}
+        self._jobs = {}
+        self._pendentes = set()
+        self._polling = {}
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_dir_changed)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(intervalo_polling_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+        for pasta, skill in self._pastas.items():
+            self._observar(pasta, skill)
+
+    # ----------------------------------------------------------
+    def _observada(self, pasta: str) -> bool:
+        return _chave(pasta) in {_chave(d) for d in self._watcher.directories()}
+
+    def _observar(self, pasta: str, skill: str):
+        """Tenta o watcher nativo; se não der, a pasta vai para o polling."""
+        if self._observada(pasta):
+            return
+        if skill_to_folder(skill).is_dir() and self._watcher.addPath(pasta):
+            self._polling.pop(pasta, None)
+        else:
+            self._polling[pasta] = self._assinatura(pasta)
+        if self._polling and not self._poll_timer.isActive():
+            self._poll_timer.start()
+        elif not self._polling:
+            self._poll_timer.stop()
+
+    @staticmethod
+    def _assinatura(pasta: str):
+        try:
+            st = os.stat(pasta)
+            return st.st_mtime_ns, st.st_ino
+        except OSError:
+            return None
+
+    def _poll(self):
+        for pasta, anterior in list(self._polling.items()):
+            atual = self._assinatura(pasta)
+            if atual != anterior:
+                self._polling[pasta] = atual
+                skill = self._pastas[pasta]
+                # pasta recém-criada: tenta promover para o watcher nativo
+                if atual is not None:
+                    self._observar(pasta, skill)
+                self._agendar(skill)
+
+    def _on_dir_changed(self, caminho: str):
+        skill = self._por_chave.get(_chave(caminho))
+        if skill is None:
+            return
+        pasta = str(skill_to_folder(skill))
+        # removida/recriada: o watcher larga o caminho, então re-registra
+        if not self._observada(pasta):
+            self._observar(pasta, skill)
+        self._agendar(skill)
+
+    # ----------------------------------------------------------
+    def _agendar(self, skill: str):
+        timer = self._timers.get(skill)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(self.debounce_ms)
+            timer.timeout.connect(lambda s=skill: self._recontar(s))
+            self._timers[skill] = timer
+        timer.start()  # reinicia a contagem a cada evento da rajada
+
+    def _recontar(self, skill: str):
+        if skill in self._jobs:
+            # já tem uma recontagem em andamento; refaz quando ela terminar
+            self._pendentes.add(skill)
+            return
+        job = RecontagemSkill(skill)
+        job.sinais.recontado.connect(self._on_recontado)
+        job.sinais.falhou.connect(lambda msg, s=skill: self._on_falhou(s, msg))
+        self._jobs[skill] = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_recontado(self, skill: str, scan):
+        self._jobs.pop(skill, None)
+        self.skillAtualizada.emit(skill, scan)
+        if skill in self._pendentes:
+            self._pendentes.discard(skill)
+            self._recontar(skill)
+
+    def _on_falhou(self, skill: str, msg: str):
+        self._jobs.pop(skill, None)
+        self._pendentes.discard(skill)
+        print(f"[AVISO] {msg}")
+
+    def parar(self):
+        self._poll_timer.stop()
+        for timer in self._timers.values():
+            timer.stop()
+        paths = self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
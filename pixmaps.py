@@ -0,0 +1,58 @@
+"""
+Pixmaps dos recursos do Qt (:/imagens/...) decodificados sob demanda.
+
+Os painéis da intro (SKILL1..9, até 512x512 = 1 MB cada depois de decodificados)
+não vêm mais no Screen.ui: a MainWindow pede cada um aqui quando a animação
+chega nele. O resultado fica no QPixmapCache, limitado a LIMITE_CACHE_KB,
+então repetir a intro (voltar ao menu) não decodifica de novo.
+"""
+
+from PySide6.QtGui import QPixmap, QPixmapCache
+
+LIMITE_CACHE_KB = 16 * 1024
+
+# painel da tela principal -> imagem (como estava no Screen.ui; 8 e 9 trocados)
+IMAGENS_PAINEIS = {
+    "painel1": "SKILL1",
+    "painel2": "SKILL2",
+    "painel3": "SKILL3",
+    "painel4": "SKILL4",
+    "painel5": "SKILL5",
+    "painel6": "SKILL6",
+    "painel7": "SKILL7",
+    "painel8": "SKILL9",
+    "painel9": "SKILL8",
+}
+
+_limite_aplicado = False
+
+
+def caminho_recurso(nome: str) -> str:
+    return f":/imagens/imagens/{nome}.png"
+
+
+def pixmap(nome: str) -> QPixmap:
+    """Pixmap de imagens/<nome>.png (recursos.qrc), decodificado uma vez."""
+    global _limite_aplicado
+    if not _limite_aplicado:
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), LIMITE_CACHE_KB))
+        _limite_aplicado = True
+
+    chave = caminho_recurso(nome)
+    pm = QPixmapCache.find(chave)
+    if pm is None:
+        pm = QPixmap(chave)
+        if pm.isNull():
+            print(f"[AVISO] Imagem não encontrada nos recursos: {chave}")
+        else:
+            QPixmapCache.insert(chave, pm)
+    return pm
+
+
+def carregar_painel(label) -> bool:
+    """Põe no QLabel do painel a sua imagem, se ainda não tiver. True se pôs."""
+    nome = IMAGENS_PAINEIS.get(label.objectName())
+    if nome is None or not label.pixmap().isNull():
+        return False
+    label.setPixmap(pixmap(nome))
+    return True
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Persistência do progresso por skill (projects / missing / percent / value).
+
+Backends:
+  - xlsx   (padrão) -> data/skills.xlsx, aba Skills (SkillExcel.py)
+  - sqlite          -> data/progresso.sqlite
+  - csv             -> data/progresso.csv
+
+O backend vem do argumento de criar_store() ou da variável de ambiente
+PORTIFOLIO_STORE. Pipelines automáticos gravam em sqlite/csv (milissegundos)
+e exportam para o xlsx só quando precisam:
+
+    python progresso_store.py --de sqlite
+"""
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import argparse
+import csv
+import os
+import sqlite3
+from pathlib import Path
+
+import historico
+
+BASE_DIR = Path(__file__).resolve().parent
+SQLITE_PROGRESSO = BASE_DIR / "data" / "progresso.sqlite"
+CSV_PROGRESSO = BASE_DIR / "data" / "progresso.csv"
+
+ENV_BACKEND = "PORTIFOLIO_STORE"
+BACKEND_PADRAO = "xlsx"
+COLUNAS = ("projects", "missing", "percent", "value")
+
+
+def linhas_progresso(progressos: dict, sobrescrever_value_com_percent=True) -> dict:
+    """
+    Converte { skill: {'count','faltam','percent'} } (calcular_progressos)
+    nas linhas gravadas: { skill: {'projects','missing','percent'[,'value']} }.
+    """
+    out = {}
+    for s, info in progressos.items():
+        valores = {
+            "projects": info["count"],
+            "missing": info["faltam"],
+            "percent": info["percent"],
+        }
+        if sobrescrever_value_com_percent:
+            valores["value"] = info["percent"]
+        out[s.strip().lower()] = valores
+    return out
+
+
+# ==============================================================
+# Interface
+# ==============================================================
+class ProgressoStore(ABC):
+    """Interface comum dos backends: ler() e gravar_linhas()."""
+
+    nome = ""
+
+    @abstractmethod
+    def ler(self) -> dict:
+        """Retorna { skill: {'projects','missing','percent','value'} }."""
+
+    @abstractmethod
+    def gravar_linhas(self, linhas: dict) -> bool:
+        """Grava as linhas; retorna True se algo mudou no armazenamento."""
+
+    def gravar(
+        self,
+        progressos: dict,
+        sobrescrever_value_com_percent=True,
+        registrar_historico=True,
+    ) -> bool:
+        """
+        Grava o resultado de calcular_progressos() e acrescenta a varredura
+        ao histórico (historico.py), mesmo quando os valores não mudaram.
+        """
+        linhas = linhas_progresso(progressos, sobrescrever_value_com_percent)
+        mudou = self.gravar_linhas(linhas)
+        if registrar_historico:
+            try:
+                historico.registrar(linhas)
+            except sqlite3.Error as e:
+                print(f"[AVISO] Falha ao registrar histórico: {e}")
+        return mudou
+
+
+# ==============================================================
+# Backends
+# ==============================================================
+class XlsxStore(ProgressoStore):
+    nome = "xlsx"
+
+    def __init__(self, caminho: Path = None):
+        # openpyxl é opcional para quem só usa sqlite/csv
+        import SkillExcel
+
+        self._xlsx = SkillExcel
+        self.caminho = Path(caminho) if caminho else SkillExcel.XLSX_SKILLS
+
+    def ler(self) -> dict:
+        return {
+            s: {c: linha.get(c) for c in COLUNAS}
+            for s, linha in self._xlsx.ler_planilha(self.caminho).items()
+        }
+
+    def gravar_linhas(self, linhas: dict) -> bool:
+        return self._xlsx.gravar_linhas_xlsx(linhas, self.caminho)
+
+
+class SqliteStore(ProgressoStore):
+    nome = "sqlite"
+
+    def __init__(self, caminho: Path = SQLITE_PROGRESSO):
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._conectar()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS progresso (
+                    skill TEXT PRIMARY KEY,
+                    projects INTEGER,
+                    missing INTEGER,
+                    percent INTEGER,
+                    value INTEGER
+                )
+                """
+            )
+        finally:
+            conn.close()
+
+    def _conectar(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.caminho))
+
+    def ler(self) -> dict:
+        conn = self._conectar()
+        try:
+            return {
+                skill: dict(zip(COLUNAS, valores))
+                for skill, *valores in conn.execute(
+                    "SELECT skill, projects, missing, percent, value FROM progresso"
+                )
+            }
+        finally:
+            conn.close()
+
+    def gravar_linhas(self, linhas: dict) -> bool:
+        conn = self._conectar()
+        try:
+            with conn:
+                antes = conn.total_changes
+                # Só toca na linha se algum valor mudou; value ausente = mantém
+                conn.executemany(
+                    """
+                    INSERT INTO progresso (skill, projects, missing, percent, value)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(skill) DO UPDATE SET
+                        projects = excluded.projects,
+                        missing = excluded.missing,
+                        percent = excluded.percent,
+                        value = COALESCE(excluded.value, progresso.value)
+                    WHERE projects IS NOT excluded.projects
+                       OR missing IS NOT excluded.missing
+                       OR percent IS NOT excluded.percent
+                       OR (excluded.value IS NOT NULL
+                           AND value IS NOT excluded.value)
+                    """,
+                    (
+                        (
+                            s,
+                            v["projects"],
+                            v["missing"],
+                            v["percent"],
+                            v.get("value"),
+                        )
+                        for s, v in linhas.items()
+                    ),
+                )
+                return conn.total_changes != antes
+        finally:
+            conn.close()
+
+
+class CsvStore(ProgressoStore):
+    nome = "csv"
+
+    def __init__(self, caminho: Path = CSV_PROGRESSO):
+        self.caminho = Path(caminho)
+
+    def ler(self) -> dict:
+        if not self.caminho.exists():
+            return {}
+
+        def inteiro(v):
+            try:
+                return int(v)
+            except (TypeError, ValueError):
+                return None
+
+        with self.caminho.open(newline="", encoding="utf-8") as f:
+            return {
+                row["skill"]: {c: inteiro(row.get(c)) for c in COLUNAS}
+                for row in csv.DictReader(f)
+                if row.get("skill")
+            }
+
+    def gravar_linhas(self, linhas: dict) -> bool:
+        atual = self.ler()
+        novo = dict(atual)
+        for s, valores in linhas.items():
+            linha = dict(atual.get(s) or dict.fromkeys(COLUNAS))
+            linha.update(valores)
+            novo[s] = linha
+        if novo == atual:
+            return False
+
+        # grava num temporário e troca: quem lê nunca vê um CSV pela metade
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.caminho.with_name(self.caminho.name + ".tmp")
+        with tmp.open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(("skill",) + COLUNAS)
+            for s, linha in novo.items():
+                w.writerow([s] + [linha.get(c) for c in COLUNAS])
+        os.replace(tmp, self.caminho)
+        return True
+
+
+BACKENDS = {
+    XlsxStore.nome: XlsxStore,
+    SqliteStore.nome: SqliteStore,
+    CsvStore.nome: CsvStore,
+}
+
+
+def criar_store(backend: str = None, caminho: Path = None) -> ProgressoStore:
+    """Instancia o backend pedido (ou o de PORTIFOLIO_STORE, ou xlsx)."""
+    nome = (backend or os.environ.get(ENV_BACKEND) or BACKEND_PADRAO).strip().lower()
+    if nome not in BACKENDS:
+        raise ValueError(
+            f"Backend de progresso desconhecido: {nome!r} "
+            f"(use {', '.join(sorted(BACKENDS))})"
+        )
+    cls = BACKENDS[nome]
+    return cls(caminho) if caminho else cls()
+
+
+def exportar_xlsx(origem: ProgressoStore, caminho: Path = None) -> bool:
+    """Copia o conteúdo de `origem` para a planilha (sob demanda)."""
+    linhas = {
+        s: {c: v for c, v in valores.items() if v is not None}
+        for s, valores in origem.ler().items()
+    }
+    return XlsxStore(caminho).gravar_linhas(linhas)
+
+
+def main():
+    p = argparse.ArgumentParser(
+        description="Exporta o progresso de um backend sqlite/csv para o xlsx."
+    )
+    p.add_argument("--de", required=True, choices=["sqlite", "csv"])
+    p.add_argument("--origem", type=Path, help="Arquivo do backend de origem")
+    p.add_argument("--xlsx", type=Path, help="Planilha de destino")
+    args = p.parse_args()
+
+    origem = criar_store(args.de, args.origem)
+    exportar_xlsx(origem, args.xlsx)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Grid virtualizado de projetos de uma skill.
+
+Um único QListView (IconMode) com modelo e delegate próprios substitui os
+QFrame/QLabel/QPushButton/QGraphicsOpacityEffect que eram criados por
+subpasta: só os cards visíveis são pintados, então abrir uma skill com
+centenas de projetos custa o mesmo que abrir uma com dez. O modelo
+(projetos_model.ProjectListModel) entrega as linhas em lotes.
+"""
+
+from PySide6.QtCore import (
+    QEasingCurve,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    QTimer,
+    QVariantAnimation,
+    Signal,
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import QAbstractItemView, QListView, QStyle, QStyledItemDelegate
+
+
+# parâmetros visuais (os mesmos do grid antigo)
+CARD_W, CARD_H = 206, 110
+H_SP, V_SP = 20, 24
+MARGEM = 24
+PADDING_CARD = 8
+# espera a rajada de resize acabar antes de reposicionar os cards
+DEBOUNCE_RELAYOUT_MS = 80
+
+
+# ==============================================================
+# Delegate (pinta o card inteiro: fundo, nome e botão "Abrir")
+# ==============================================================
+class CardDelegate(QStyledItemDelegate):
+    def __init__(self, view: "ProjetosGrid", cores: dict):
+        """
+        cores: {'base', 'hover', 'pressed', 'text'} do botão (hex), da
+        Paleta da skill (tema.py).
+        """
+        super().__init__(view)
+        self.view = view
+        self.definir_cores(cores)
+        self.fonte_nome = QFont()
+        self.fonte_nome.setPixelSize(13)
+        self.fonte_nome.setBold(True)
+        self.fonte_botao = QFont()
+        self.fonte_botao.setWeight(QFont.DemiBold)
+        fm = QFontMetrics(self.fonte_botao)
+        # padding 6px 12px + borda de 1px, como no QSS do botão antigo
+        self._tam_botao = QSize(
+            fm.horizontalAdvance("Abrir") + 26, fm.height() + 14
+        )
+
+    def definir_cores(self, cores: dict):
+        self.cores = {k: QColor(v) for k, v in cores.items()}
+        self.view.viewport().update()
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(CARD_W, CARD_H)
+
+    def rect_card(self, item_rect: QRect) -> QRect:
+        return QRect(item_rect.topLeft(), QSize(CARD_W, CARD_H))
+
+    def rect_botao(self, card: QRect) -> QRect:
+        w, h = self._tam_botao.width(), self._tam_botao.height()
+        return QRect(
+            card.center().x() - w // 2,
+            card.bottom() - PADDING_CARD - h - 4,
+            w,
+            h,
+        )
+
+    def paint(self, painter: QPainter, option, index):
+        row = index.row()
+        opacidade, dy = self.view.estado_card(row)
+        if opacidade <= 0.0:
+            return
+
+        card = self.rect_card(option.rect).translated(0, dy)
+        # card atual do teclado ganha o mesmo destaque do hover
+        hover = bool(option.state & (QStyle.State_MouseOver | QStyle.State_HasFocus))
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setOpacity(opacidade)
+
+        # fundo + borda do card
+        if hover:
+            painter.setPen(QPen(self.cores["base"], 2))
+            painter.setBrush(QColor(60, 60, 60, 230))
+            painter.drawRoundedRect(QRectF(card).adjusted(1, 1, -1, -1), 10, 10)
+        else:
+            painter.setPen(QPen(QColor("#555555"), 1))
+            painter.setBrush(QColor(40, 40, 40, 191))
+            painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        # nome do projeto
+        botao = self.rect_botao(card)
+        area_nome = QRect(
+            card.left() + PADDING_CARD + 2,
+            card.top() + PADDING_CARD + 2,
+            card.width() - 2 * (PADDING_CARD + 2),
+            botao.top() - card.top() - PADDING_CARD - 6,
+        )
+        painter.setFont(self.fonte_nome)
+        painter.setPen(QColor("white"))
+        painter.drawText(
+            area_nome,
+            Qt.AlignCenter | Qt.TextWordWrap,
+            index.data(Qt.DisplayRole) or "",
+        )
+
+        # botão "Abrir"
+        if self.view.botao_pressionado == row:
+            fundo = self.cores["pressed"]
+        elif self.view.botao_hover == row:
+            fundo = self.cores["hover"]
+        else:
+            fundo = self.cores["base"]
+        borda = self.cores["hover"] if self.view.botao_hover == row else fundo
+        painter.setPen(QPen(borda, 1))
+        painter.setBrush(fundo)
+        painter.drawRoundedRect(QRectF(botao).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+        painter.setFont(self.fonte_botao)
+        painter.setPen(self.cores["text"])
+        painter.drawText(botao, Qt.AlignCenter, "Abrir")
+
+        painter.restore()
+
+
+# ==============================================================
+# View
+# ==============================================================
+class ProjetosGrid(QListView):
+    """QListView em modo ícone; só pinta os cards que estão na tela."""
+
+    abrirProjeto = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        # relayout manual: só quando o nº de colunas muda (ver resizeEvent)
+        self.setResizeMode(QListView.Fixed)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setGridSize(QSize(CARD_W + H_SP, CARD_H + V_SP))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.NoFrame)
+        self.setMouseTracking(True)
+        # setas escolhem o card, Enter/Espaço abrem (como o antigo botão focável)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.doubleClicked.connect(self._abrir_index)
+        self.setViewportMargins(MARGEM - H_SP // 2, MARGEM - V_SP // 2, 0, 0)
+        self.setStyleSheet("QListView { background: transparent; border: none; }")
+
+        # animação de entrada: linha -> (opacidade, deslocamento em px)
+        self._estados = {}
+        self._estado_padrao = (1.0, 0)
+        self._rows_anim = []
+        self._param_anim = (0, 1, 0)
+        self._anim = None
+        self._curva = QEasingCurve(QEasingCurve.OutCubic)
+        self._inicio_anim = QTimer(self)
+        self._inicio_anim.setSingleShot(True)
+        self._inicio_anim.timeout.connect(self._iniciar_animacao)
+
+        self._colunas = 0
+        self._relayout = QTimer(self)
+        self._relayout.setSingleShot(True)
+        self._relayout.setInterval(DEBOUNCE_RELAYOUT_MS)
+        self._relayout.timeout.connect(self.scheduleDelayedItemsLayout)
+        self.botao_hover = -1
+        self.botao_pressionado = -1
+
+    # ---------- layout ----------
+    def colunas(self) -> int:
+        return max(1, self.viewport().width() // self.gridSize().width())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        colunas = self.colunas()
+        if colunas != self._colunas:
+            # mesma quantidade de colunas = mesmas posições: nada a refazer
+            self._colunas = colunas
+            self._relayout.start()  # reinicia a cada evento da rajada
+
+    # ---------- animação de entrada ----------
+    def estado_card(self, row: int):
+        return self._estados.get(row, self._estado_padrao)
+
+    def animar_entrada(
+        self,
+        passo_ms: int = 40,
+        dur_ms: int = 200,
+        desloc_px: int = 14,
+        atraso_ms: int = 120,
+    ):
+        """
+        Cascata de entrada (fade + sobe desloc_px) dos cards visíveis, com um
+        único QVariantAnimation: card k começa k*passo_ms depois do primeiro.
+        Até começar, todos ficam invisíveis; os fora da tela não animam.
+        """
+        self.parar_animacao()
+        self._param_anim = (passo_ms, dur_ms, desloc_px)
+        self._estado_padrao = (0.0, desloc_px)
+        self.viewport().update()
+        # espera o layout (Batched) posicionar os itens antes de ver quem aparece
+        self._inicio_anim.start(atraso_ms)
+
+    def _iniciar_animacao(self):
+        passo_ms, dur_ms, desloc_px = self._param_anim
+        modelo = self.model()
+        area = self.viewport().rect()
+        self._rows_anim = [
+            row
+            for row in range(modelo.rowCount() if modelo is not None else 0)
+            if self.visualRect(modelo.index(row, 0)).intersects(area)
+        ]
+        if not self._rows_anim:
+            self.encerrar_animacao()
+            return
+        # quem não está na tela já entra no estado final
+        self._estado_padrao = (1.0, 0)
+        for row in self._rows_anim:
+            self._estados[row] = (0.0, desloc_px)
+
+        total = (len(self._rows_anim) - 1) * passo_ms + dur_ms
+        self._anim = QVariantAnimation(self)
+        self._anim.setStartValue(0.0)
+        self._anim.setEndValue(float(total))
+        self._anim.setDuration(total)
+        self._anim.valueChanged.connect(self._quadro)
+        self._anim.finished.connect(self.encerrar_animacao)
+        self._anim.start()
+
+    def _quadro(self, t_ms: float):
+        passo_ms, dur_ms, desloc_px = self._param_anim
+        for k, row in enumerate(self._rows_anim):
+            prog = min(1.0, max(0.0, (t_ms - k * passo_ms) / dur_ms))
+            e = self._curva.valueForProgress(prog)
+            self._estados[row] = (e, round(desloc_px * (1.0 - e)))
+        self.viewport().update()
+
+    def parar_animacao(self):
+        """Interrompe a cascata (pendente ou rodando) sem mudar os estados."""
+        self._inicio_anim.stop()
+        if self._anim is not None:
+            self._anim.finished.disconnect(self.encerrar_animacao)
+            self._anim.stop()
+            self._anim.deleteLater()
+            self._anim = None
+
+    def encerrar_animacao(self):
+        """Todos os cards no estado final; libera o estado da animação."""
+        self.parar_animacao()
+        self._estados.clear()
+        self._rows_anim = []
+        self._estado_padrao = (1.0, 0)
+        self.viewport().update()
+
+    # ---------- botão "Abrir" pintado pelo delegate ----------
+    def _row_no_botao(self, pos) -> int:
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return -1
+        delegate = self.itemDelegate()
+        card = delegate.rect_card(self.visualRect(index))
+        return index.row() if delegate.rect_botao(card).contains(pos) else -1
+
+    def _atualizar_row(self, row: int):
+        if row >= 0 and self.model() is not None:
+            self.update(self.model().index(row, 0))
+
+    def mouseMoveEvent(self, event):
+        row = self._row_no_botao(event.position().toPoint())
+        if row != self.botao_hover:
+            anterior, self.botao_hover = self.botao_hover, row
+            self._atualizar_row(anterior)
+            self._atualizar_row(row)
+            if row >= 0:
+                self.viewport().setCursor(Qt.PointingHandCursor)
+            else:
+                self.viewport().unsetCursor()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        anterior, self.botao_hover = self.botao_hover, -1
+        self._atualizar_row(anterior)
+        self.viewport().unsetCursor()
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.botao_pressionado = self._row_no_botao(event.position().toPoint())
+            self._atualizar_row(self.botao_pressionado)
+        super().mousePressEvent(event)
+
+    def _abrir_index(self, index):
+        if index.isValid():
+            self.abrirProjeto.emit(self.model().caminho(index.row()))
+
+    def mouseDoubleClickEvent(self, event):
+        if self._row_no_botao(event.position().toPoint()) >= 0:
+            # no botão o primeiro clique já abriu o projeto
+            event.accept()
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space):
+            index = self.currentIndex()
+            if index.isValid():
+                self._abrir_index(index)
+                return
+        super().keyPressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        row, self.botao_pressionado = self.botao_pressionado, -1
+        if row >= 0:
+            self._atualizar_row(row)
+            if self._row_no_botao(event.position().toPoint()) == row:
+                self.abrirProjeto.emit(self.model().caminho(row))
+        super().mouseReleaseEvent(event)
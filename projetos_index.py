@@ -0,0 +1,421 @@
+"""
+Índice único de Projetos/<Skill>.
+
+Varre cada pasta de skill uma única vez e devolve um snapshot imutável
+(pastas, arquivos, mtimes) reaproveitado pela GUI (main.py), pela planilha
+(SkillExcel.py) e pelo gerador do counts.json (tools/build_counts.py).
+As listagens ficam em cache (data/projetos_cache.sqlite) e só são refeitas
+quando o mtime/inode da pasta da skill muda; as pastas são lidas em paralelo.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+PROJETOS_DIR = BASE_DIR / "Projetos"
+MAX_PROJETOS_POR_SKILL = 50
+CACHE_DB = BASE_DIR / "data" / "projetos_cache.sqlite"
+
+# Pastas alteradas há menos que isso (em relação à varredura) não são
+# reaproveitadas: outra mudança no mesmo "tick" não moveria o mtime.
+_JANELA_MTIME_NS = 2_000_000_000
+_VERSAO_CACHE = 2
+
+# Varredura paralela: threads simultâneas e prazo por pasta (segundos)
+SCAN_WORKERS = 8
+SCAN_TIMEOUT_S = 10.0
+
+
+def cap(skill: str) -> str:
+    """Capitaliza o nome da pasta (Excel, Powerbi, etc.)"""
+    s = (skill or "").strip()
+    return s[:1].upper() + s[1:].lower()
+
+
+def skill_to_folder(skill: str) -> Path:
+    return PROJETOS_DIR / cap(skill)
+
+
+# ==============================================================
+# Snapshot de uma skill
+# ==============================================================
+@dataclass(frozen=True)
+class SkillScan:
+    skill: str
+    pasta: Path
+    existe: bool = False
+    mtime: float = 0.0
+    pastas: tuple[str, ...] = ()
+    arquivos: tuple[str, ...] = ()
+    # Só preenchido quando a varredura pede `com_mtimes=True`
+    mtimes: dict[str, float] = field(default_factory=dict, compare=False)
+    # True quando a listagem estourou o timeout: dados do cache ou, sem
+    # cache, estado desconhecido (existe=False). Não entra no progresso.
+    expirado: bool = False
+
+    @property
+    def count(self) -> int:
+        return len(self.pastas)
+
+    @property
+    def faltam(self) -> int:
+        return max(0, MAX_PROJETOS_POR_SKILL - self.count)
+
+    @property
+    def percent(self) -> int:
+        return min(100, round((self.count / MAX_PROJETOS_POR_SKILL) * 100))
+
+    def progresso(self) -> dict:
+        """Formato histórico: {'count', 'faltam', 'percent'}."""
+        return {"count": self.count, "faltam": self.faltam, "percent": self.percent}
+
+
+@dataclass(frozen=True)
+class ProjetosIndex:
+    skills: dict[str, SkillScan]
+
+    def __getitem__(self, skill: str) -> SkillScan:
+        return self.skills[skill]
+
+    def __contains__(self, skill: str) -> bool:
+        return skill in self.skills
+
+    def __iter__(self):
+        return iter(self.skills.values())
+
+    def progressos(self) -> dict:
+        """
+        Retorna: { skill: {'count':int, 'faltam':int, 'percent':int} }
+        """
+        return {s: scan.progresso() for s, scan in self.skills.items()}
+
+    def com(self, scan: SkillScan) -> "ProjetosIndex":
+        """Novo índice com `scan` no lugar da skill correspondente."""
+        return ProjetosIndex({**self.skills, scan.skill: scan})
+
+
+# ==============================================================
+# Varredura
+# ==============================================================
+def listar_pasta(pasta: Path, com_mtimes: bool = False) -> tuple[list, list, dict]:
+    """
+    Lista `pasta` numa única passada com os.scandir, devolvendo
+    (subpastas, arquivos, mtimes). O tipo vem do próprio DirEntry, sem
+    stat() por entrada; só links simbólicos são resolvidos (um stat cada).
+    Com `com_mtimes`, DirEntry.stat() é chamado (gratuito no Windows).
+    """
+    pastas, arquivos, mtimes = [], [], {}
+    with os.scandir(pasta) as it:
+        for entry in it:
+            try:
+                if entry.is_symlink():
+                    eh_dir, eh_arq = entry.is_dir(), entry.is_file()
+                else:
+                    eh_dir = entry.is_dir(follow_symlinks=False)
+                    eh_arq = not eh_dir and entry.is_file(follow_symlinks=False)
+                if eh_dir:
+                    pastas.append(entry.name)
+                elif eh_arq:
+                    arquivos.append(entry.name)
+                else:
+                    continue
+                if com_mtimes:
+                    mtimes[entry.name] = entry.stat().st_mtime
+            except OSError:
+                continue
+    return pastas, arquivos, mtimes
+
+
+def _listar(
+    skill: str, pasta: Path, st_pasta: os.stat_result, com_mtimes: bool = False
+) -> SkillScan:
+    try:
+        pastas, arquivos, mtimes = listar_pasta(pasta, com_mtimes)
+    except OSError as e:
+        print(f"[AVISO] Falha ao listar {pasta}: {e}")
+        pastas, arquivos, mtimes = [], [], {}
+
+    return SkillScan(
+        skill,
+        pasta,
+        existe=True,
+        mtime=st_pasta.st_mtime,
+        pastas=tuple(sorted(pastas)),
+        arquivos=tuple(sorted(arquivos)),
+        mtimes=mtimes,
+    )
+
+
+def escanear_skill(skill: str, com_mtimes: bool = False) -> SkillScan:
+    """Lista Projetos/<SkillCap> direto do disco, sem cache."""
+    pasta = skill_to_folder(skill)
+    try:
+        st_pasta = pasta.stat()
+    except OSError:
+        return SkillScan(skill, pasta)
+    return _listar(skill, pasta, st_pasta, com_mtimes)
+
+
+# ==============================================================
+# Cache persistente (SQLite) por mtime/inode da pasta
+# ==============================================================
+class _ScanCache:
+    """
+    Guarda a listagem de cada Projetos/<Skill> junto do mtime/inode da pasta.
+    Criar/remover/renomear um filho altera o mtime do diretório, então uma
+    pasta com mesmo mtime/inode pode ser reaproveitada sem listar de novo.
+    Os mtimes dos filhos refletem a última listagem feita.
+    """
+
+    def __init__(self, caminho: Path):
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(caminho))
+        versao = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if versao != _VERSAO_CACHE:
+            self.conn.execute("DROP TABLE IF EXISTS pastas")
+            self.conn.execute(f"PRAGMA user_version = {_VERSAO_CACHE}")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pastas (
+                pasta TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                varrido_ns INTEGER NOT NULL,
+                pastas TEXT NOT NULL,
+                arquivos TEXT NOT NULL,
+                mtimes TEXT NOT NULL,
+                com_mtimes INTEGER NOT NULL
+            )
+            """
+        )
+
+    def linha(self, pasta: Path):
+        return self.conn.execute(
+            "SELECT mtime_ns, ino, varrido_ns, pastas, arquivos, mtimes, com_mtimes"
+            " FROM pastas WHERE pasta = ?",
+            (str(pasta),),
+        ).fetchone()
+
+    def gravar(
+        self,
+        scan: SkillScan,
+        st: os.stat_result,
+        varrido_ns: int,
+        com_mtimes: bool = False,
+    ):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pastas VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(scan.pasta),
+                st.st_mtime_ns,
+                st.st_ino,
+                varrido_ns,
+                json.dumps(scan.pastas, ensure_ascii=False),
+                json.dumps(scan.arquivos, ensure_ascii=False),
+                json.dumps(scan.mtimes, ensure_ascii=False),
+                int(com_mtimes),
+            ),
+        )
+
+    def fechar(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def _scan_da_linha(
+    linha, skill: str, pasta: Path, st: os.stat_result, com_mtimes: bool = False
+):
+    """Reaproveita a linha do cache se a pasta não mudou; senão None."""
+    if linha is None:
+        return None
+    mtime_ns, ino, varrido_ns, pastas, arquivos, mtimes, tem_mtimes = linha
+    if mtime_ns != st.st_mtime_ns or ino != st.st_ino:
+        return None
+    if com_mtimes and not tem_mtimes:
+        return None
+    # Mudança no mesmo "tick" do mtime que a varredura não seria detectada
+    if varrido_ns - mtime_ns < _JANELA_MTIME_NS:
+        return None
+    return SkillScan(
+        skill,
+        pasta,
+        existe=True,
+        mtime=st.st_mtime,
+        pastas=tuple(json.loads(pastas)),
+        arquivos=tuple(json.loads(arquivos)),
+        mtimes=json.loads(mtimes),
+    )
+
+
+def _escanear_pasta(skill: str, pasta: Path, linha, com_mtimes: bool = False):
+    """
+    Trabalho de uma skill (roda nas threads, sem tocar no SQLite).
+    Retorna (scan, stat da pasta, varrido_ns) — varrido_ns é None quando
+    a listagem veio do cache e não precisa ser regravada.
+    """
+    try:
+        st_pasta = pasta.stat()
+    except OSError:
+        return SkillScan(skill, pasta), None, None
+
+    scan = _scan_da_linha(linha, skill, pasta, st_pasta, com_mtimes)
+    if scan is not None:
+        return scan, st_pasta, None
+    varrido_ns = time.time_ns()
+    return _listar(skill, pasta, st_pasta, com_mtimes), st_pasta, varrido_ns
+
+
+def _expirado(skill: str, pasta: Path, linha) -> SkillScan:
+    """
+    Pasta que estourou o timeout: usa a última listagem conhecida, se houver;
+    sem ela não dá para dizer nem se a pasta existe.
+    """
+    if linha is not None:
+        _, _, _, pastas, arquivos, mtimes, _ = linha
+        return SkillScan(
+            skill,
+            pasta,
+            existe=True,
+            pastas=tuple(json.loads(pastas)),
+            arquivos=tuple(json.loads(arquivos)),
+            mtimes=json.loads(mtimes),
+            expirado=True,
+        )
+    return SkillScan(skill, pasta, expirado=True)
+
+
+def _esperar_com_prazo(futuros: dict, inicio: dict, timeout: float, workers: int):
+    """
+    Espera os futuros com prazo por pasta: `timeout` a partir do início de
+    cada listagem. Volta quando todos terminaram ou estouraram, ou quando
+    as threads livres acabaram (todas presas em pastas estouradas).
+    """
+    estourados = set()
+    while True:
+        agora = time.monotonic()
+        pendentes = []
+        proximo_prazo = None
+        for s, fut in futuros.items():
+            if fut.done() or s in estourados:
+                continue
+            t0 = inicio.get(s)
+            if t0 is not None and agora >= t0 + timeout:
+                estourados.add(s)
+                continue
+            pendentes.append(fut)
+            if t0 is not None:
+                fim = t0 + timeout
+                if proximo_prazo is None or fim < proximo_prazo:
+                    proximo_prazo = fim
+        if not pendentes:
+            return
+        # thread presa numa pasta estourada não volta para a fila
+        if sum(not futuros[s].done() for s in estourados) >= workers:
+            return
+        espera = timeout if proximo_prazo is None else proximo_prazo - agora
+        wait(pendentes, timeout=espera, return_when=FIRST_COMPLETED)
+
+
+def escanear(
+    skills: list[str],
+    usar_cache: bool = True,
+    com_mtimes: bool = False,
+    max_workers: int = SCAN_WORKERS,
+    timeout: float = SCAN_TIMEOUT_S,
+) -> ProjetosIndex:
+    """
+    Varre as skills em paralelo (até `max_workers` threads): em SMB/NFS cada
+    listagem espera a rede, então as esperas se sobrepõem em vez de somar.
+    Cada pasta tem até `timeout` segundos contados de quando a listagem dela
+    começa (None = sem limite); a que estourar volta com a última listagem
+    do cache e `expirado=True`, sem segurar as outras. Se todas as threads
+    ficarem presas em pastas estouradas, as que nem começaram também voltam
+    do cache.
+    Com `usar_cache`, pastas cujo mtime/inode não mudou vêm do CACHE_DB:
+    uma inicialização "quente" faz só um stat() por skill.
+    """
+    cache = None
+    if usar_cache:
+        try:
+            cache = _ScanCache(CACHE_DB)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[AVISO] Cache de projetos indisponível ({CACHE_DB}): {e}")
+
+    try:
+        pastas = {s: skill_to_folder(s) for s in skills}
+        linhas = {}
+        if cache is not None:
+            try:
+                linhas = {s: cache.linha(p) for s, p in pastas.items()}
+            except sqlite3.Error as e:
+                print(f"[AVISO] Cache de projetos corrompido, varrendo direto: {e}")
+                linhas = {}
+
+        workers = max(1, min(max_workers or 1, len(skills) or 1))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan")
+        inicio = {}  # skill -> time.monotonic() de quando a listagem começou
+
+        def tarefa(s, p):
+            inicio[s] = time.monotonic()
+            return _escanear_pasta(s, p, linhas.get(s), com_mtimes)
+
+        try:
+            futuros = {s: pool.submit(tarefa, s, p) for s, p in pastas.items()}
+            if timeout is None:
+                wait(futuros.values())
+            else:
+                _esperar_com_prazo(futuros, inicio, timeout, workers)
+        finally:
+            # Não bloqueia esperando uma listagem travada no compartilhamento
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        out = {}
+        for s, fut in futuros.items():
+            if not fut.done() or fut.cancelled():
+                origem = "usando cache" if linhas.get(s) else "sem cache"
+                print(f"[AVISO] Timeout listando {pastas[s]}; {origem}.")
+                out[s] = _expirado(s, pastas[s], linhas.get(s))
+                continue
+            scan, st_pasta, varrido_ns = fut.result()
+            out[s] = scan
+            if cache is not None and varrido_ns is not None:
+                try:
+                    cache.gravar(scan, st_pasta, varrido_ns, com_mtimes)
+                except sqlite3.Error as e:
+                    print(f"[AVISO] Falha gravando cache de projetos: {e}")
+        return ProjetosIndex(out)
+    finally:
+        if cache is not None:
+            try:
+                cache.fechar()
+            except sqlite3.Error:
+                pass
+
+
+# ==============================================================
+# Atalhos compatíveis com a API antiga
+# ==============================================================
+def contar_projetos(skill: str) -> int:
+    """Conta subpastas imediatas em Projetos/<SkillCap>."""
+    return escanear_skill(skill).count
+
+
+def calcular_progressos(skills: list[str], index: ProjetosIndex = None) -> dict:
+    """
+    Retorna: { skill: {'count':int, 'faltam':int, 'percent':int} }
+    Reaproveita `index` quando informado, sem tocar no disco. Skills cuja
+    listagem estourou o timeout ficam de fora: o progresso anterior vale.
+    """
+    if index is None:
+        index = escanear(skills)
+    out = {}
+    for s in skills:
+        scan = index[s] if s in index else escanear_skill(s)
+        if not scan.expirado:
+            out[s] = scan.progresso()
+    return out
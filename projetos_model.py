@@ -0,0 +1,87 @@
+"""
+Modelo Qt dos projetos de uma skill (subpastas de Projetos/<Skill>).
+
+Vem direto do SkillScan (projetos_index), então o grid e uma busca futura
+(QSortFilterProxyModel por cima) enxergam o mesmo snapshot. As linhas
+entram na view em lotes via canFetchMore/fetchMore: uma pasta com milhares
+de projetos começa com um lote e o resto é inserido conforme o usuário rola.
+
+Os lotes só limitam quantas linhas a view recebe de uma vez. A listagem da
+pasta em si não é feita em partes: o escanear() já leu e ordenou todos os
+nomes em SkillScan.pastas (e guarda o resultado no cache do índice).
+
+Quando a pasta muda, atualizar() aplica só a diferença (linhas removidas e
+inseridas): a view mantém a rolagem e não repinta os cards que ficaram.
+"""
+
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from PySide6.QtCore import QModelIndex, QStringListModel
+
+from projetos_index import SkillScan
+
+TAMANHO_LOTE = 200
+
+
+class ProjectListModel(QStringListModel):
+    """
+    Uma linha por projeto do SkillScan (o nome da pasta), carregadas em lotes.
+
+    Os dados ficam no QStringListModel do Qt, sem data() em Python: a view
+    lê o texto direto do C++. O caminho do projeto sai de caminho(row).
+    """
+
+    def __init__(self, scan: SkillScan, tamanho_lote: int = TAMANHO_LOTE, parent=None):
+        super().__init__(parent)
+        self.scan = scan
+        self.pasta = Path(scan.pasta)
+        self.tamanho_lote = max(1, int(tamanho_lote))
+        self._carregados = min(self.tamanho_lote, len(scan.pastas))
+        self.setStringList(list(scan.pastas[: self._carregados]))
+
+    @property
+    def total(self) -> int:
+        """Projetos no scan (carregados ou não)."""
+        return len(self.scan.pastas)
+
+    def caminho(self, row: int) -> str:
+        """Caminho completo do projeto da linha row."""
+        return str(self.pasta / self.scan.pastas[row])
+
+    def atualizar(self, scan: SkillScan):
+        """
+        Troca o snapshot por `scan` no lugar, removendo e inserindo só as
+        linhas que mudaram entre as já carregadas.
+        """
+        atuais = self.stringList()
+        carregar = min(len(scan.pastas), max(len(atuais), self.tamanho_lote))
+        novos = list(scan.pastas[:carregar])
+        operacoes = SequenceMatcher(None, atuais, novos, autojunk=False).get_opcodes()
+        # de trás para frente: os índices das operações seguintes não mudam
+        for op, i1, i2, j1, j2 in reversed(operacoes):
+            if op in ("delete", "replace"):
+                self.removeRows(i1, i2 - i1)
+            if op in ("insert", "replace"):
+                self.insertRows(i1, j2 - j1)
+                for k, nome in enumerate(novos[j1:j2]):
+                    self.setData(self.index(i1 + k), nome)
+        self.scan = scan
+        self.pasta = Path(scan.pasta)
+        self._carregados = carregar
+
+    # ---------- QStringListModel ----------
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._carregados < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        n = min(self.tamanho_lote, self.total - self._carregados)
+        if n <= 0:
+            return
+        inicio = self._carregados
+        self.insertRows(inicio, n)
+        for i, nome in enumerate(self.scan.pastas[inicio : inicio + n]):
+            self.setData(self.index(inicio + i), nome)
+        self._carregados += n
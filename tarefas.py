@@ -0,0 +1,89 @@
+"""
+Tarefas em segundo plano (QThreadPool) usadas pela MainWindow.
+
+O trabalho pesado de inicialização (varrer Projetos/ e regravar
+data/skills.xlsx) roda fora da thread da GUI; os resultados voltam por
+sinais, entregues na thread da janela.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from progresso_store import criar_store
+from projetos_index import calcular_progressos, escanear
+
+
+class SinaisStartup(QObject):
+    # ProjetosIndex pronto: as barras já podem ser preenchidas
+    indexado = Signal(object)
+    # planilha atualizada (ou pulada): fim da tarefa
+    concluido = Signal()
+    falhou = Signal(str)
+
+
+class AtualizacaoStartup(QRunnable):
+    """
+    Varre Projetos/<Skill> e grava o progresso, nessa ordem. O destino é o
+    backend de progresso_store.criar_store() (xlsx por padrão).
+    """
+
+    def __init__(self, skills: list[str], sobrescrever_value_com_percent=True):
+        super().__init__()
+        self.skills = list(skills)
+        self.sobrescrever_value_com_percent = sobrescrever_value_com_percent
+        self.sinais = SinaisStartup()
+
+    def run(self):
+        try:
+            index = escanear(self.skills)
+        except Exception as e:
+            self.sinais.falhou.emit(f"Falha ao varrer Projetos/: {e}")
+            return
+        self.sinais.indexado.emit(index)
+
+        try:
+            store = criar_store()
+        except ImportError as e:
+            # backend xlsx sem openpyxl instalado
+            print(
+                f"[AVISO] Backend de progresso indisponível ({e}); "
+                "pulando atualização automática."
+            )
+        except ValueError as e:
+            self.sinais.falhou.emit(str(e))
+            return
+        else:
+            # skills que estouraram o timeout não entram (nem no histórico)
+            prog = calcular_progressos(self.skills, index)
+            try:
+                # Atualiza o progresso (xlsx: colunas projects/missing/percent)
+                if prog:
+                    store.gravar(prog, self.sobrescrever_value_com_percent)
+            except Exception as e:
+                self.sinais.falhou.emit(
+                    f"Falha ao gravar o progresso ({store.nome}): {e}"
+                )
+                return
+        self.sinais.concluido.emit()
+
+
+class SinaisRecontagem(QObject):
+    # skill, SkillScan
+    recontado = Signal(str, object)
+    falhou = Signal(str)
+
+
+class RecontagemSkill(QRunnable):
+    """Relista uma única Projetos/<Skill> (passando pelo cache de varredura)."""
+
+    def __init__(self, skill: str):
+        super().__init__()
+        self.skill = skill
+        self.sinais = SinaisRecontagem()
+
+    def run(self):
+        try:
+            scan = escanear([self.skill])[self.skill]
+        except Exception as e:
+            self.sinais.falhou.emit(f"Falha ao recontar {self.skill}: {e}")
+            return
+        self.sinais.recontado.emit(self.skill, scan)
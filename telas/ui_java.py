@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'java.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QGridLayout, QLabel,
+    QPushButton, QScrollArea, QSizePolicy, QWidget)
+import recursos_rc
+import recursos_rc
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        if not Dialog.objectName():
+            Dialog.setObjectName(u"Dialog")
+        Dialog.resize(1200, 798)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Dialog.sizePolicy().hasHeightForWidth())
+        Dialog.setSizePolicy(sizePolicy)
+        self.scrollArea = QScrollArea(Dialog)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setGeometry(QRect(450, 240, 711, 521))
+        self.scrollArea.setStyleSheet(u"")
+        self.scrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 709, 519))
+        sizePolicy.setHeightForWidth(self.scrollAreaWidgetContents.sizePolicy().hasHeightForWidth())
+        self.scrollAreaWidgetContents.setSizePolicy(sizePolicy)
+        self.scrollAreaWidgetContents.setStyleSheet(u"background-color: #202020;")
+        self.gridLayoutWidget = QWidget(self.scrollAreaWidgetContents)
+        self.gridLayoutWidget.setObjectName(u"gridLayoutWidget")
+        self.gridLayoutWidget.setGeometry(QRect(0, 0, 711, 521))
+        self.gridLayout = QGridLayout(self.gridLayoutWidget)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(0, 0, 0, 0)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.btnProx = QPushButton(Dialog)
+        self.btnProx.setObjectName(u"btnProx")
+        self.btnProx.setGeometry(QRect(220, 20, 161, 41))
+        self.btnProx.setStyleSheet(u"QPushButton {\n"
+"    border: 2px solid white;\n"
+"    color: white;\n"
+"    background-color: transparent;\n"
+"    border-radius: 10px; /* opcional para cantos arredondados */\n"
+"    padding: 6px 14px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background-color: rgba(255, 255, 255, 0.1); /* leve brilho no hover */\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: rgba(255, 255, 255, 0.2);\n"
+"}\n"
+"")
+        self.btnVoltar = QPushButton(Dialog)
+        self.btnVoltar.setObjectName(u"btnVoltar")
+        self.btnVoltar.setGeometry(QRect(30, 20, 161, 41))
+        self.btnVoltar.setStyleSheet(u"QPushButton {\n"
+"    border: 2px solid white;\n"
+"    color: white;\n"
+"    background-color: transparent;\n"
+"    border-radius: 10px; /* opcional para cantos arredondados */\n"
+"    padding: 6px 14px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background-color: rgba(255, 255, 255, 0.1); /* leve brilho no hover */\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: rgba(255, 255, 255, 0.2);\n"
+"}\n"
+"")
+        self.label = QLabel(Dialog)
+        self.label.setObjectName(u"label")
+        self.label.setGeometry(QRect(0, 0, 1201, 801))
+        self.label.setPixmap(QPixmap(u":/imagens/imagens/logo.png"))
+        self.label.setScaledContents(True)
+        self.label_2 = QLabel(Dialog)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setGeometry(QRect(0, 0, 411, 801))
+        self.label_2.setPixmap(QPixmap(u":/imagens/imagens/logo5.png"))
+        self.label_2.setScaledContents(True)
+        self.label_3 = QLabel(Dialog)
+        self.label_3.setObjectName(u"label_3")
+        self.label_3.setGeometry(QRect(410, 30, 791, 71))
+        font = QFont()
+        font.setFamilies([u"Cascadia Code"])
+        font.setPointSize(28)
+        font.setBold(True)
+        self.label_3.setFont(font)
+        self.label_3.setStyleSheet(u"QLabel{\n"
+"    color: white;\n"
+"    background-color: transparent;\n"
+"    font-weight: bold;\n"
+"}\n"
+"\n"
+"")
+        self.label_3.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label_4 = QLabel(Dialog)
+        self.label_4.setObjectName(u"label_4")
+        self.label_4.setGeometry(QRect(410, 130, 791, 41))
+        font1 = QFont()
+        font1.setFamilies([u"Cascadia Code"])
+        font1.setPointSize(22)
+        font1.setBold(True)
+        self.label_4.setFont(font1)
+        self.label_4.setStyleSheet(u"QLabel{\n"
+"    color: white;\n"
+"    background-color: transparent;\n"
+"    font-weight: bold;\n"
+"}\n"
+"\n"
+"")
+        self.label_4.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label.raise_()
+        self.label_2.raise_()
+        self.scrollArea.raise_()
+        self.btnProx.raise_()
+        self.btnVoltar.raise_()
+        self.label_3.raise_()
+        self.label_4.raise_()
+
+        self.retranslateUi(Dialog)
+
+        QMetaObject.connectSlotsByName(Dialog)
+    # setupUi
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Dialog", None))
+        self.btnProx.setText(QCoreApplication.translate("Dialog", u"PROXIMA SKILL", None))
+        self.btnVoltar.setText(QCoreApplication.translate("Dialog", u"VOLTAR", None))
+        self.label.setText("")
+        self.label_2.setText("")
+        self.label_3.setText(QCoreApplication.translate("Dialog", u"JAVA DEVELOPER", None))
+        self.label_4.setText(QCoreApplication.translate("Dialog", u"\u25ca PROJETOS \u25ca", None))
+    # retranslateUi
+
+
+# Classe do widget de topo (usada por ui_loader.carregar_ui)
+CLASSE_RAIZ = "QDialog"
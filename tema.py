@@ -0,0 +1,103 @@
+"""
+Paleta de cores por skill, compartilhada entre o app (QSS) e o WEB/.
+
+As cores-base ficam em CORES_SKILLS; a partir delas cada Paleta (base,
+hover, pressed, focus, texto, hover da barra de rolagem) é derivada uma
+única vez, no import. Os geradores de QSS do main.py e o
+tools/build_counts.py (que grava as paletas no counts.json) leem daqui,
+então a conta de cor não se repete a cada folha de estilo.
+"""
+
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+
+COR_PADRAO = "#00b894"
+
+CORES_SKILLS = {
+    "excel": "#00ff62",
+    "powerbi": "#f2c811",
+    "vba": "#9000f0",
+    "sql": "#00a2ff",
+    "java": "#ff0000",
+    "python": "#f2c811",
+    "ia": "#9000f0",
+    "redes": "#00a2ff",
+    "process": "#ff0000",
+}
+
+
+def _hex_to_rgb(hx: str):
+    hx = hx.strip().lstrip("#")
+    if len(hx) == 3:
+        hx = "".join(c * 2 for c in hx)
+    r = int(hx[0:2], 16)
+    g = int(hx[2:4], 16)
+    b = int(hx[4:6], 16)
+    return r, g, b
+
+
+def _rgb_to_hex(r: int, g: int, b: int) -> str:
+    return "#{:02x}{:02x}{:02x}".format(
+        max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))
+    )
+
+
+def _blend(rgb, factor: float, to_white=True):
+    """factor 0..1: aproxima de branco (to_white=True) ou preto (False)."""
+    r, g, b = rgb
+    if to_white:
+        return (
+            int(r + (255 - r) * factor),
+            int(g + (255 - g) * factor),
+            int(b + (255 - b) * factor),
+        )
+    else:
+        return (int(r * (1 - factor)), int(g * (1 - factor)), int(b * (1 - factor)))
+
+
+def _auto_text_color(rgb) -> str:
+    # luminância relativa aproximada -> escolhe preto ou branco
+    r, g, b = [c / 255 for c in rgb]
+    lum = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    return "#000000" if lum > 0.6 else "#ffffff"
+
+
+@dataclass(frozen=True)
+class Paleta:
+    base: str
+    rgb: tuple
+    hover: str  # 18% mais claro
+    pressed: str  # 18% mais escuro
+    focus: str
+    text: str  # preto ou branco, conforme a luminância da base
+    scrollbar_hover: str  # 25% mais claro
+
+    def como_dict(self) -> dict:
+        d = asdict(self)
+        d["rgb"] = list(self.rgb)
+        return d
+
+
+@lru_cache(maxsize=None)
+def paleta(base_hex: str) -> Paleta:
+    """Paleta derivada de uma cor (memorizada: a conta roda uma vez por cor)."""
+    rgb = _hex_to_rgb(base_hex)
+    hover = _rgb_to_hex(*_blend(rgb, 0.18, to_white=True))
+    return Paleta(
+        base=base_hex,
+        rgb=rgb,
+        hover=hover,
+        pressed=_rgb_to_hex(*_blend(rgb, 0.18, to_white=False)),
+        focus=hover,
+        text=_auto_text_color(rgb),
+        scrollbar_hover=_rgb_to_hex(*_blend(rgb, 0.25, to_white=True)),
+    )
+
+
+# derivadas no import (startup), uma por skill
+PALETAS = {skill: paleta(cor) for skill, cor in CORES_SKILLS.items()}
+
+
+def paleta_da_skill(skill: str) -> Paleta:
+    """Paleta da tabela PALETAS (a padrão para skills fora dela)."""
+    return PALETAS.get(skill.strip().lower()) or paleta(COR_PADRAO)
@@ -0,0 +1,142 @@
+"""
+Tempo de montagem do grid de projetos com 50, 500 e 5000 cards (a troca
+dos widgets por card pelo QListView virtualizado).
+
+Compara o grid antigo (QFrame + QLabel + QPushButton por card, cada um com
+a própria folha de estilo) com o atual (main.preencher_grid_projetos:
+QListView + delegate, uma folha por skill). O tempo inclui o primeiro
+processamento de eventos, onde o Qt interpreta o QSS e pinta a tela.
+
+Uso: python tools/bench_grid.py [--cards 50 500 5000]
+"""
+
+from pathlib import Path
+import argparse
+import dataclasses
+import os
+import sys
+import time
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+os.chdir(BASE)
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import (  # noqa: E402
+    QApplication,
+    QFrame,
+    QGridLayout,
+    QLabel,
+    QPushButton,
+)
+
+import main as portifolio  # noqa: E402
+
+COR = "#00ff62"
+
+
+def qss_botao_legado(base_hex: str) -> str:
+    """QSS do botão "Abrir" de cada card do grid antigo (era o main.make_button_qss)."""
+    p = portifolio.paleta(base_hex)
+    text_hex, hover_hex, press_hex, focus_hex = p.text, p.hover, p.pressed, p.focus
+
+    return f"""
+        QPushButton {{
+            background-color: {base_hex};
+            color: {text_hex};
+            border: 1px solid transparent;
+            border-radius: 6px;
+            padding: 6px 12px;
+            font-weight: 600;
+        }}
+        QPushButton:hover {{
+            background-color: {hover_hex};
+            color: {text_hex};
+            border: 1px solid {focus_hex};
+        }}
+        QPushButton:focus {{
+            border: 2px solid {focus_hex};
+        }}
+        QPushButton:pressed {{
+            background-color: {press_hex};
+            color: {text_hex};
+        }}
+        QPushButton:disabled {{
+            background-color: #555;
+            color: #bbb;
+            border: 1px solid #555;
+        }}
+    """
+
+
+def grid_legado(tela, nomes, btn_hex):
+    """Mesma construção do preencher_grid_projetos anterior ao QListView."""
+    scroll_widget = tela.scrollAreaWidgetContents
+    grid = QGridLayout(scroll_widget)
+    for i, nome in enumerate(nomes):
+        slot = QFrame(scroll_widget)
+        slot.setFixedSize(206, 110)
+        slot.setStyleSheet("background: transparent;")
+        card = QFrame(slot)
+        card.setObjectName("cardProjeto")
+        card.setGeometry(0, 0, 206, 110)
+        card.setStyleSheet(
+            f"""
+            QFrame#cardProjeto {{
+                background-color: rgba(40, 40, 40, 0.75);
+                border: 1px solid #555;
+                border-radius: 10px;
+            }}
+            QFrame#cardProjeto:hover {{
+                border: 2px solid {btn_hex};
+                background-color: rgba(60, 60, 60, 0.9);
+            }}
+        """
+        )
+        label = QLabel(nome, card)
+        label.setAlignment(Qt.AlignCenter)
+        label.setStyleSheet("color: white; font-size: 13px; font-weight: bold;")
+        botao = QPushButton("Abrir", card)
+        botao.setStyleSheet(qss_botao_legado(btn_hex))
+        lay = QGridLayout(card)
+        lay.addWidget(label, 0, 0, Qt.AlignCenter)
+        lay.addWidget(botao, 1, 0, Qt.AlignCenter)
+        grid.addWidget(slot, i // 3, i % 3)
+
+
+def medir(nome, montar, n, app):
+    tela = portifolio.carregar_ui(str(BASE / "telas" / "excel.ui"))
+    tela.resize(1200, 800)
+    tela.show()
+    app.processEvents()
+    t0 = time.perf_counter()
+    montar(tela)
+    app.processEvents()
+    dt = time.perf_counter() - t0
+    print(f"{nome:<10} {n:>6} cards {dt * 1000:10.1f} ms")
+    tela.close()
+    tela.deleteLater()
+    app.processEvents()
+
+
+def main():
+    p = argparse.ArgumentParser(description="Grid antigo (widgets) x QListView.")
+    p.add_argument("--cards", type=int, nargs="+", default=[50, 500, 5000])
+    args = p.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    scan_base = portifolio.escanear_skill("excel")
+    for n in args.cards:
+        nomes = [f"EXEMPLO {i}" for i in range(n)]
+        scan = dataclasses.replace(scan_base, existe=True, pastas=tuple(nomes))
+        medir("widgets", lambda t: grid_legado(t, nomes, COR), n, app)
+        medir(
+            "qlistview",
+            lambda t: portifolio.preencher_grid_projetos(t, "excel", COR, scan=scan),
+            n,
+            app,
+        )
+
+
+if __name__ == "__main__":
+    main()
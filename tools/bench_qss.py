@@ -0,0 +1,95 @@
+"""
+Custo das folhas de estilo do menu e das telas de skill.
+
+  - geração: make_menu_button_qss / make_scrollbar_qss para as 9 skills,
+    memorizados (lru_cache) x sem cache (__wrapped__), N vezes;
+  - menu: os 9 botões com uma folha cada (antes) x uma folha só no
+    framePrincipal com seletores por objectName (main.MainWindow). O tempo
+    inclui o processamento de eventos em que o Qt interpreta o QSS e pinta.
+
+Uso: python tools/bench_qss.py [--repeticoes 1000]
+"""
+
+from pathlib import Path
+import argparse
+import os
+import sys
+import time
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+os.chdir(BASE)
+
+from PySide6.QtWidgets import QApplication, QDialog  # noqa: E402
+
+import main as portifolio  # noqa: E402
+from Screen import Ui_Dialog  # noqa: E402
+from tema import CORES_SKILLS  # noqa: E402
+
+
+def gerar(menu, scrollbar, repeticoes: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeticoes):
+        for skill, cor in CORES_SKILLS.items():
+            menu(cor, f"QPushButton#btn{skill}")
+            scrollbar(cor)
+    return (time.perf_counter() - t0) * 1000
+
+
+def estilizar_menu(app, uma_folha: bool) -> float:
+    dlg = QDialog()
+    ui = Ui_Dialog()
+    ui.setupUi(dlg)
+    dlg.resize(1200, 800)
+    dlg.show()
+    app.processEvents()
+
+    gerar_qss = portifolio.make_menu_button_qss.__wrapped__
+    t0 = time.perf_counter()
+    if uma_folha:
+        for skill in CORES_SKILLS:
+            getattr(ui, f"btn{skill}").setStyleSheet("")
+        ui.framePrincipal.setStyleSheet(
+            ui.framePrincipal.styleSheet()
+            + "".join(
+                gerar_qss(cor, f"QPushButton#btn{skill}")
+                for skill, cor in CORES_SKILLS.items()
+            )
+        )
+    else:
+        for skill, cor in CORES_SKILLS.items():
+            getattr(ui, f"btn{skill}").setStyleSheet(gerar_qss(cor))
+    app.processEvents()
+    dt = (time.perf_counter() - t0) * 1000
+
+    dlg.close()
+    dlg.deleteLater()
+    app.processEvents()
+    return dt
+
+
+def main():
+    p = argparse.ArgumentParser(description="Geração e aplicação do QSS por skill")
+    p.add_argument("--repeticoes", type=int, default=1000)
+    args = p.parse_args()
+    n = args.repeticoes
+
+    sem_cache = gerar(
+        portifolio.make_menu_button_qss.__wrapped__,
+        portifolio.make_scrollbar_qss.__wrapped__,
+        n,
+    )
+    com_cache = gerar(
+        portifolio.make_menu_button_qss, portifolio.make_scrollbar_qss, n
+    )
+    print(f"geração 9 skills x {n}: sem cache {sem_cache:8.1f} ms")
+    print(f"geração 9 skills x {n}: com cache {com_cache:8.1f} ms")
+
+    app = QApplication.instance() or QApplication([])
+    estilizar_menu(app, True)  # aquece fontes/estilo antes de medir
+    print(f"menu, uma folha por botão    {estilizar_menu(app, False):8.1f} ms")
+    print(f"menu, uma folha no container {estilizar_menu(app, True):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Tempo de import e memória do recursos_rc: módulo Python com os PNGs
+embutidos (saída padrão do pyside6-rcc) x recursos.rcc registrado em tempo
+de execução (recursos_rc.py atual).
+
+O módulo antigo é regerado num diretório temporário. Cada medição roda num
+processo novo: "frio" sem .pyc (compila o módulo), "quente" com .pyc.
+
+Uso: python tools/bench_recursos.py [--repeticoes 5]
+"""
+
+from pathlib import Path
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BASE = Path(__file__).resolve().parents[1]
+
+# importa recursos_rc e devolve "segundos kb": o QtCore já vem carregado, então
+# só o custo do próprio recursos_rc entra na conta (kb = aumento do maxrss,
+# -1 onde o módulo resource não existe)
+_SONDA = """
+import sys, time
+from PySide6.QtCore import QFile
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def maxrss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+
+sys.path.insert(0, sys.argv[1])
+rss0 = maxrss()
+t0 = time.perf_counter()
+import recursos_rc
+dt = time.perf_counter() - t0
+rss = maxrss() - rss0 if resource else -1
+assert QFile.exists(":/imagens/imagens/logo.png"), "recurso não registrado"
+print(dt, rss)
+"""
+
+
+def medir(pasta: Path, frio: bool, repeticoes: int):
+    tempos, rss = [], []
+    for _ in range(repeticoes):
+        if frio:
+            shutil.rmtree(pasta / "__pycache__", ignore_errors=True)
+        saida = subprocess.run(
+            [sys.executable, "-c", _SONDA, str(pasta)],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=pasta,
+        ).stdout.split()
+        tempos.append(float(saida[0]) * 1000)
+        rss.append(int(saida[1]))
+    return statistics.median(tempos), max(rss)
+
+
+def main():
+    p = argparse.ArgumentParser(description="recursos_rc.py embutido x .rcc")
+    p.add_argument("--repeticoes", type=int, default=5)
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        antigo = Path(tmp) / "antigo"
+        novo = Path(tmp) / "novo"
+        antigo.mkdir()
+        novo.mkdir()
+        subprocess.run(
+            ["pyside6-rcc", "recursos.qrc", "-o", str(antigo / "recursos_rc.py")],
+            check=True,
+            cwd=BASE,
+        )
+        shutil.copy(BASE / "recursos_rc.py", novo)
+        shutil.copy(BASE / "recursos.rcc", novo)
+
+        print(f"{'':<22} {'import (ms)':>12} {'+maxrss (KB)':>12}")
+        for nome, pasta in (("embutido (.py)", antigo), ("binário (.rcc)", novo)):
+            for frio in (True, False):
+                dt, rss = medir(pasta, frio, args.repeticoes)
+                rotulo = f"{nome} {'frio' if frio else 'quente'}"
+                print(f"{rotulo:<22} {dt:12.1f} {rss:12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Microbenchmark da varredura de Projetos/<Skill>.
+
+Cria uma árvore sintética (50k entradas por padrão, metade pastas e metade
+arquivos) e compara a listagem antiga (iterdir + is_dir/is_file) com
+projetos_index.listar_pasta (os.scandir), contando as chamadas a os.stat.
+
+Uso: python tools/bench_scan.py [--entradas 50000]
+"""
+
+from pathlib import Path
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+from projetos_index import listar_pasta  # noqa: E402
+
+
+def listar_antigo(pasta: Path) -> tuple[list, list]:
+    """Mesma lógica do antigo tools/build_counts.py::listar_projetos."""
+    subpastas, arquivos = [], []
+    for item in pasta.iterdir():
+        if item.is_dir():
+            subpastas.append(item.name)
+        elif item.is_file():
+            arquivos.append(item.name)
+    return subpastas, arquivos
+
+
+def criar_arvore(raiz: Path, entradas: int):
+    for i in range(entradas):
+        if i % 2:
+            (raiz / f"arquivo {i}.txt").touch()
+        else:
+            (raiz / f"EXEMPLO {i}").mkdir()
+
+
+def medir(nome: str, fn, pasta: Path):
+    contador = [0]
+    stat_original = os.stat
+
+    def stat_contado(*a, **k):
+        contador[0] += 1
+        return stat_original(*a, **k)
+
+    os.stat = stat_contado
+    try:
+        t0 = time.perf_counter()
+        res = fn(pasta)
+        dt = time.perf_counter() - t0
+    finally:
+        os.stat = stat_original
+    print(
+        f"{nome:<22} {dt * 1000:9.1f} ms  stat(): {contador[0]:>7}"
+        f"  pastas: {len(res[0])}  arquivos: {len(res[1])}"
+    )
+    return res
+
+
+def main():
+    p = argparse.ArgumentParser(description="Compara iterdir+is_dir com os.scandir.")
+    p.add_argument("--entradas", type=int, default=50_000)
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pasta = Path(tmp)
+        criar_arvore(pasta, args.entradas)
+        print(f"[BENCH] {args.entradas} entradas em {pasta}")
+
+        antigo = medir("iterdir + is_dir", listar_antigo, pasta)
+        novo = medir("scandir", listar_pasta, pasta)
+        # DirEntry.stat() não passa por os.stat: aqui só o tempo é comparável
+        medir("scandir + mtimes", lambda p: listar_pasta(p, com_mtimes=True), pasta)
+
+        if sorted(antigo[0]) != sorted(novo[0]) or sorted(antigo[1]) != sorted(
+            novo[1]
+        ):
+            raise SystemExit("[ERRO] As duas listagens divergem.")
+
+
+if __name__ == "__main__":
+    main()
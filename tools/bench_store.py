@@ -0,0 +1,83 @@
+"""
+Benchmark dos backends de progresso (progresso_store.py).
+
+Para cada tamanho (linhas de skill), mede em cada backend:
+  - gravação inicial (arquivo vazio)
+  - atualização com uma única linha alterada
+  - regravação sem mudanças (deve sair sem tocar no arquivo)
+
+Uso: python tools/bench_store.py [--tamanhos 10 1000 100000] [--backends xlsx sqlite csv]
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import tempfile
+import time
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+from progresso_store import BACKENDS, criar_store  # noqa: E402
+
+
+def gerar_progressos(n: int, bump: int = 0) -> dict:
+    out = {}
+    for i in range(n):
+        c = (i % 50) + (bump if i == n // 2 else 0)
+        out[f"skill{i:06d}"] = {
+            "count": c,
+            "faltam": max(0, 50 - c),
+            "percent": min(100, c * 2),
+        }
+    return out
+
+
+def criar_planilha_vazia(caminho: Path):
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Skills"
+    ws.append(["skill", "value", "projects", "missing", "percent"])
+    wb.save(caminho)
+    wb.close()
+
+
+def medir(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    p = argparse.ArgumentParser(description="Latência de gravação por backend.")
+    p.add_argument("--tamanhos", type=int, nargs="+", default=[10, 1_000, 100_000])
+    p.add_argument("--backends", nargs="+", default=list(BACKENDS))
+    args = p.parse_args()
+
+    print(f"{'backend':<8} {'linhas':>8} {'inicial':>12} {'1 mudança':>12} {'sem mudança':>12}")
+    for n in args.tamanhos:
+        inicial = gerar_progressos(n)
+        alterado = gerar_progressos(n, bump=1)
+        for nome in args.backends:
+            with tempfile.TemporaryDirectory() as tmp:
+                ext = {"xlsx": "xlsx", "sqlite": "sqlite", "csv": "csv"}[nome]
+                caminho = Path(tmp) / f"progresso.{ext}"
+                if nome == "xlsx":
+                    criar_planilha_vazia(caminho)
+                store = criar_store(nome, caminho)
+
+                # o histórico não entra na medida (nem suja data/historico.sqlite)
+                def gravar(prog):
+                    return store.gravar(prog, registrar_historico=False)
+
+                t_ini = medir(lambda: gravar(inicial))
+                t_upd = medir(lambda: gravar(alterado))
+                t_nada = medir(lambda: gravar(alterado))
+                print(
+                    f"{nome:<8} {n:>8} {t_ini:>10.1f}ms {t_upd:>10.1f}ms {t_nada:>10.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
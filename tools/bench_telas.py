@@ -0,0 +1,67 @@
+"""
+Latência de abertura de cada telas/*.ui: QUiLoader (XML em tempo de
+execução) x módulo compilado telas/ui_<nome>.py (tools/compilar_telas.py).
+
+A primeira abertura compilada inclui o import do módulo; as demais só o
+setupUi. Roda sem janela (QT_QPA_PLATFORM=offscreen se não houver display).
+
+Uso: python tools/bench_telas.py [--repeticoes 20]
+"""
+
+from pathlib import Path
+import argparse
+import os
+import statistics
+import sys
+import time
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+os.chdir(BASE)
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import ui_loader  # noqa: E402
+
+
+def medir(fn, repeticoes: int) -> tuple[float, float]:
+    """(primeira, mediana das seguintes) em ms."""
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        w = fn()
+        tempos.append((time.perf_counter() - t0) * 1000)
+        w.deleteLater()
+    return tempos[0], statistics.median(tempos[1:] or tempos)
+
+
+def main():
+    p = argparse.ArgumentParser(description="QUiLoader x telas compiladas.")
+    p.add_argument("--repeticoes", type=int, default=20)
+    args = p.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    print(
+        f"{'tela':<12} {'xml 1ª':>9} {'xml med':>9} "
+        f"{'comp 1ª':>9} {'comp med':>9}"
+    )
+    for ui in sorted((BASE / "telas").glob("*.ui")):
+        mod = ui_loader._modulo_compilado(ui)
+        if mod is None:
+            print(f"{ui.stem:<12} sem módulo compilado em dia (rode compilar_telas.py)")
+            continue
+        ui_loader._modulos.clear()  # a 1ª abertura compilada inclui o import
+
+        xml = medir(lambda: ui_loader._carregar_xml(str(ui)), args.repeticoes)
+        comp = medir(
+            lambda: ui_loader._carregar_compilado(ui_loader._modulo_compilado(ui)),
+            args.repeticoes,
+        )
+        print(
+            f"{ui.stem:<12} {xml[0]:9.2f} {xml[1]:9.2f} {comp[0]:9.2f} {comp[1]:9.2f}"
+        )
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,31 @@
 from pathlib import Path
 import json
+import sys
 
 # Caminhos base
 BASE = Path(__file__).resolve().parents[1]  # .../PORTIFOLIO
-PROJETOS = BASE / "Projetos"
 WEB_DATA = BASE / "WEB" / "data"
 WEB_DATA.mkdir(parents=True, exist_ok=True)
 
+sys.path.insert(0, str(BASE))
+from projetos_index import escanear  # noqa: E402
+from tema import paleta_da_skill  # noqa: E402
+
 # Skills (nomes das pastas dentro de "Projetos")
 skills = ["excel", "powerbi", "vba", "sql", "java", "python", "ia", "redes", "process"]
 
 
-def cap(skill: str) -> str:
-    """Capitaliza o nome da pasta (Excel, Python, etc.)"""
-    return skill[:1].upper() + skill[1:].lower()
-
-
-def listar_projetos(skill: str) -> dict:
-    """Retorna os nomes de subpastas e arquivos de uma skill."""
-    pasta = PROJETOS / cap(skill)
-    if not pasta.exists():
-        return {"pastas": [], "arquivos": []}
-
-    subpastas = []
-    arquivos = []
-
-    for item in pasta.iterdir():
-        if item.is_dir():
-            subpastas.append(item.name)
-        elif item.is_file():
-            arquivos.append(item.name)
-
-    return {"pastas": sorted(subpastas), "arquivos": sorted(arquivos)}
-
-
-# Gera estrutura completa
+# Gera estrutura completa (uma única varredura de Projetos/); sem prazo, para
+# não publicar uma pasta lenta como vazia
+index = escanear(skills, timeout=None)
 dados = {}
 
-for skill in skills:
-    info = listar_projetos(skill)
-    dados[skill] = {
-        "quantidade_pastas": len(info["pastas"]),
-        "quantidade_arquivos": len(info["arquivos"]),
-        "pastas": info["pastas"],
-        "arquivos": info["arquivos"],
+for scan in index:
+    dados[scan.skill] = {
+        "quantidade_pastas": len(scan.pastas),
+        "quantidade_arquivos": len(scan.arquivos),
+        "pastas": list(scan.pastas),
+        "arquivos": list(scan.arquivos),
     }
 
 # Estrutura final no JSON
@@ -53,6 +35,8 @@ out = {
     "total_geral": sum(
         v["quantidade_pastas"] + v["quantidade_arquivos"] for v in dados.values()
     ),
+    # mesma paleta do app (tema.py): o site não refaz a conta de cor
+    "temas": {s: paleta_da_skill(s).como_dict() for s in skills},
 }
 
 # Grava o JSON
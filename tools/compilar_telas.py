@@ -0,0 +1,66 @@
+"""
+Compila telas/*.ui para telas/ui_<nome>.py com o pyside6-uic.
+
+Mesmo esquema do Screen.ui -> Screen.py (CONVERTER.bat): o ui_loader
+importa o módulo compilado em vez de interpretar o XML com o QUiLoader a
+cada abertura de tela. Se o .ui for editado depois (Designer), o loader
+volta a usar o QUiLoader até a próxima compilação.
+
+    python tools/compilar_telas.py
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+BASE = Path(__file__).resolve().parents[1]
+TELAS_DIR = BASE / "telas"
+
+sys.path.insert(0, str(BASE))
+from ui_loader import caminho_compilado  # noqa: E402
+
+
+def classe_raiz(ui: Path) -> str:
+    """Classe do widget de topo do .ui (ex.: QDialog)."""
+    for _, elem in ET.iterparse(ui, events=("start",)):
+        if elem.tag == "widget":
+            return elem.get("class", "QWidget")
+    return "QWidget"
+
+
+def compilar(ui: Path) -> Path:
+    destino = caminho_compilado(ui)
+    gerado = subprocess.run(
+        ["pyside6-uic", str(ui)],
+        check=True,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    ).stdout
+    # o loader precisa saber que widget criar antes do setupUi
+    gerado = gerado.rstrip() + (
+        "\n\n\n# Classe do widget de topo (usada por ui_loader.carregar_ui)\n"
+        f'CLASSE_RAIZ = "{classe_raiz(ui)}"\n'
+    )
+    destino.write_text(gerado, encoding="utf-8")
+    return destino
+
+
+def main():
+    uis = sorted(TELAS_DIR.glob("*.ui"))
+    if not uis:
+        print(f"[AVISO] Nenhum .ui em {TELAS_DIR}")
+        return
+    for ui in uis:
+        try:
+            destino = compilar(ui)
+        except FileNotFoundError:
+            sys.exit("[ERRO] pyside6-uic não encontrado (instale o PySide6).")
+        except subprocess.CalledProcessError as e:
+            sys.exit(f"[ERRO] pyside6-uic falhou em {ui.name}:\n{e.stderr}")
+        print(f"[OK] {ui.name} -> {destino.name}")
+
+
+if __name__ == "__main__":
+    main()
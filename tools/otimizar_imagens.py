@@ -0,0 +1,191 @@
+"""
+Gera variantes reduzidas e recomprimidas de imagens/ para cada destino.
+
+As imagens originais ficam como estão (são a fonte). Para cada ALVO a
+ferramenta grava em imagens/otimizadas/<alvo>/ uma cópia no tamanho em que
+a imagem é exibida (painéis da intro 201x208, fundo 1200x800, fundo do
+site) e, no alvo "web", também um .webp. O manifest.json guarda o
+sha256 de cada original e os parâmetros usados: se nada mudou, a imagem
+não é processada de novo.
+
+No fim grava recursos_otimizados.qrc, igual ao recursos.qrc mas com alias
+apontando para as variantes do alvo "qt" (os caminhos :/imagens/... não
+mudam). O CONVERTER.bat compila o recursos.rcc a partir dele.
+
+Precisa do Pillow (pip install pillow); sem ele só o .qrc é regravado, com
+as variantes que já existirem.
+
+    python tools/otimizar_imagens.py [--forcar]
+"""
+
+from pathlib import Path
+import argparse
+import hashlib
+import json
+import xml.etree.ElementTree as ET
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+BASE = Path(__file__).resolve().parents[1]
+IMAGENS_DIR = BASE / "imagens"
+SAIDA_DIR = IMAGENS_DIR / "otimizadas"
+MANIFEST = SAIDA_DIR / "manifest.json"
+QRC = BASE / "recursos.qrc"
+QRC_OTIMIZADO = BASE / "recursos_otimizados.qrc"
+
+# alvo -> {padrão do arquivo: lado maior em px (None = só recomprime)}
+# tamanhos = como as imagens aparecem nos .ui e no WEB/style.css
+ALVOS = {
+    "qt": {
+        "SKILL*.png": 416,  # painéis de 201x208, com folga para tela 2x
+        "logo.png": 1200,  # fundo das telas, 1200x800
+        # logo1..9 (faixa lateral 411x801) já estão no tamanho de exibição
+    },
+    "web": {
+        "web.png": 1024,  # fundo do site (background-size: cover)
+    },
+}
+
+# formatos gerados por alvo; "original" = mesmo formato e nome do original
+# (os logo*.png, por exemplo, são JPEG com extensão .png)
+FORMATOS = {"qt": ("original",), "web": ("original", "webp")}
+QUALIDADE_WEBP = 80
+QUALIDADE_JPEG = 85
+
+
+def sha256(caminho: Path) -> str:
+    h = hashlib.sha256()
+    with caminho.open("rb") as f:
+        for bloco in iter(lambda: f.read(1 << 16), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def carregar_manifest() -> dict:
+    try:
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def gravar(img, destino: Path, formato: str):
+    if formato == "WEBP":
+        img.save(destino, "WEBP", quality=QUALIDADE_WEBP, method=6)
+    elif formato == "JPEG":
+        img.save(
+            destino, "JPEG", quality=QUALIDADE_JPEG, optimize=True, progressive=True
+        )
+    else:
+        img.save(destino, "PNG", optimize=True)
+
+
+def gerar(origem: Path, alvo: str, lado: int | None) -> list[str]:
+    """Grava as variantes de uma imagem; devolve os caminhos (relativos a BASE)."""
+    pasta = SAIDA_DIR / alvo
+    pasta.mkdir(parents=True, exist_ok=True)
+    with Image.open(origem) as img:
+        formato_original = img.format or "PNG"
+        img.load()
+        if lado and max(img.size) > lado:
+            img.thumbnail((lado, lado), Image.LANCZOS)
+        saidas = []
+        for formato in FORMATOS[alvo]:
+            if formato == "original":
+                destino = pasta / origem.name
+                formato = formato_original
+            else:
+                destino = pasta / f"{origem.stem}.{formato}"
+            gravar(img, destino, formato.upper())
+            saidas.append(destino.relative_to(BASE).as_posix())
+    return saidas
+
+
+def processar(forcar: bool = False) -> dict:
+    manifest = carregar_manifest()
+    novo = {}
+    for alvo, padroes in ALVOS.items():
+        for padrao, lado in padroes.items():
+            for origem in sorted(IMAGENS_DIR.glob(padrao)):
+                chave = f"{alvo}/{origem.name}"
+                params = {"lado": lado, "formatos": list(FORMATOS[alvo])}
+                params["qualidade"] = [QUALIDADE_JPEG, QUALIDADE_WEBP]
+                hash_ = sha256(origem)
+                anterior = manifest.get(chave)
+                if (
+                    not forcar
+                    and anterior
+                    and anterior["sha256"] == hash_
+                    and anterior["params"] == params
+                    and all((BASE / s).exists() for s in anterior["saidas"])
+                ):
+                    novo[chave] = anterior
+                    continue
+
+                saidas = gerar(origem, alvo, lado)
+                antes = origem.stat().st_size
+                depois = (BASE / saidas[0]).stat().st_size
+                print(
+                    f"[OK] {chave}: {antes // 1024} KB -> "
+                    + ", ".join(
+                        f"{Path(s).suffix[1:]} {(BASE / s).stat().st_size // 1024} KB"
+                        for s in saidas
+                    )
+                    + ("" if depois < antes else "  [AVISO] não ficou menor")
+                )
+                novo[chave] = {
+                    "sha256": hash_,
+                    "params": params,
+                    "saidas": saidas,
+                }
+
+    SAIDA_DIR.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(
+        json.dumps(novo, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+    return novo
+
+
+def variante_qt(manifest: dict, arquivo: str) -> str:
+    """Caminho (relativo a BASE) a usar no .qrc para imagens/<arquivo>."""
+    item = manifest.get(f"qt/{Path(arquivo).name}")
+    if item and (BASE / item["saidas"][0]).exists():
+        # só troca se a variante for mesmo menor que o original
+        if (BASE / item["saidas"][0]).stat().st_size < (BASE / arquivo).stat().st_size:
+            return item["saidas"][0]
+    return arquivo
+
+
+def gravar_qrc(manifest: dict):
+    arvore = ET.parse(QRC)
+    for f in arvore.iter("file"):
+        arquivo = f.text.strip()
+        variante = variante_qt(manifest, arquivo)
+        if variante != arquivo:
+            f.set("alias", arquivo)  # mantém :/imagens/imagens/<nome>
+        f.text = variante
+    ET.indent(arvore)
+    arvore.write(QRC_OTIMIZADO, encoding="unicode")
+    print(f"[OK] Gerado {QRC_OTIMIZADO.name}")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Variantes otimizadas de imagens/")
+    p.add_argument(
+        "--forcar", action="store_true", help="reprocessa mesmo sem mudança"
+    )
+    args = p.parse_args()
+
+    if Image is None:
+        # usa as variantes que já existirem (ex.: geradas em outra máquina)
+        print("[AVISO] Pillow não instalado; imagens não foram reprocessadas.")
+        manifest = carregar_manifest()
+    else:
+        manifest = processar(args.forcar)
+    gravar_qrc(manifest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Smoke check do bundle.py: uma página sem <link>, <script> nem <img> tem
+que sair do Empacotador byte a byte igual, com o HTML entregue inteiro ou
+em pedaços (o corte pode cair no meio de uma tag ou de uma entidade).
+
+Também confere o WEB/index.html com e sem --inline-images: o resultado não
+pode mudar ao repetir o empacotamento.
+
+Uso: python tools/smoke_bundle.py
+"""
+
+from pathlib import Path
+import io
+import sys
+import tempfile
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+from bundle import Empacotador, empacotar  # noqa: E402
+
+# entidades sem ";", tags em maiúsculas, atributos sem aspas, comentários,
+# declarações, <style> com "<" dentro e um <style> sem fechamento no fim
+PAGINA = """<!DOCTYPE html>
+<HTML LANG=pt-BR>
+<Head><META charset=utf-8><Title>AT&T x&y &amp &amp; &#169 &#x41; &copy</Title>
+<style>p > a { content: "<b>&amp;</b>"; }</style></HEAD>
+<BODY class = 'x'>
+  <!-- comentário com <tags> & entidades -->
+  <![CDATA[ bruto ]]>
+  <?php echo 1 ?>
+  <P>AT&T x&y</P><br/><BR >
+  <a href="?a=1&b=2">link</a> 3 < 4 && 5 > 4
+  <textarea></P>&lt;</textarea>
+</BODY>
+</HTML>
+<style>sem fechamento & <b>
+"""
+
+
+def rodar(html: str, bloco: int) -> str:
+    out = io.StringIO()
+    p = Empacotador(out, BASE)
+    for i in range(0, len(html), bloco):
+        p.feed(html[i : i + bloco])
+    p.close()
+    return out.getvalue()
+
+
+def main():
+    erros = []
+    for bloco in (1, 7, 64, len(PAGINA)):
+        saida = rodar(PAGINA, bloco)
+        if saida != PAGINA:
+            erros.append(f"página sem substituições mudou (blocos de {bloco})")
+
+    html = BASE / "WEB" / "index.html"
+    counts = BASE / "WEB" / "data" / "counts.json"
+    with tempfile.TemporaryDirectory() as tmp:
+        for inline in (False, True):
+            a, b = Path(tmp) / "a.html", Path(tmp) / "b.html"
+            empacotar(html, a, counts, inline)
+            empacotar(html, b, counts, inline)
+            if a.read_bytes() != b.read_bytes():
+                erros.append(f"WEB/index.html não é determinístico (inline={inline})")
+
+    for e in erros:
+        print(f"[ERRO] {e}")
+    if erros:
+        sys.exit(1)
+    print("[OK] bundle.py copia o HTML sem alterar o que não substitui")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Smoke check do grid de projetos: monta o ProjetosGrid (modelo + delegate)
+com 1000 projetos, carrega todos os lotes, roda a cascata de entrada e
+repinta a tela N vezes.
+
+Falha se a contagem de referências do None cair durante as repinturas
+(binding com o bug do main.binding_perde_none: o app morreria com
+"Fatal Python error: none_dealloc") ou se o modelo não entregar as linhas.
+
+Uso: python tools/smoke_grid.py [--repinturas 300]
+"""
+
+from pathlib import Path
+import argparse
+import os
+import sys
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+os.chdir(BASE)
+
+from PySide6.QtCore import QEventLoop, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from projetos_grid import CardDelegate, ProjetosGrid  # noqa: E402
+from projetos_index import SkillScan  # noqa: E402
+from projetos_model import ProjectListModel  # noqa: E402
+from tema import paleta_da_skill  # noqa: E402
+
+TOTAL = 1000
+
+
+def esperar(app, ms: int):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def main():
+    p = argparse.ArgumentParser(description="Smoke check do grid de projetos")
+    p.add_argument("--repinturas", type=int, default=300)
+    args = p.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    nomes = tuple(f"Projeto {i:04d}" for i in range(TOTAL))
+    scan = SkillScan("excel", BASE / "Projetos" / "Excel", True, pastas=nomes)
+
+    grid = ProjetosGrid()
+    grid.resize(1000, 600)
+    pal = paleta_da_skill("excel")
+    grid.setItemDelegate(
+        CardDelegate(
+            grid,
+            {"base": pal.base, "hover": pal.hover, "pressed": pal.pressed, "text": pal.text},
+        )
+    )
+    modelo = ProjectListModel(scan, parent=grid)
+    grid.setModel(modelo)
+    grid.show()
+    grid.animar_entrada(atraso_ms=0)
+    esperar(app, 600)
+
+    while modelo.canFetchMore():
+        modelo.fetchMore()
+    erros = []
+    if modelo.rowCount() != TOTAL:
+        erros.append(f"{modelo.rowCount()} linhas carregadas, esperado {TOTAL}")
+    if modelo.index(TOTAL - 1).data() != nomes[-1]:
+        erros.append("texto da última linha não confere")
+    if modelo.caminho(5) != str(scan.pasta / nomes[5]):
+        erros.append("caminho(5) não confere")
+
+    antes = sys.getrefcount(None)
+    limite = args.repinturas // 2
+    for i in range(args.repinturas):
+        grid.botao_hover = i % 4  # alterna o estado do botão "Abrir"
+        grid.viewport().repaint()
+        perda = antes - sys.getrefcount(None)
+        if perda > limite:
+            # para antes que o None chegue a zero e o processo aborte
+            erros.append(f"None perdeu {perda} referências em {i + 1} repinturas")
+            break
+
+    for e in erros:
+        print(f"[ERRO] {e}")
+    if erros:
+        # sem finalização: com o None já corrompido o coletor abortaria aqui
+        sys.stdout.flush()
+        os._exit(1)
+    print(f"[OK] {TOTAL} projetos, {args.repinturas} repinturas sem perder o None")
+
+
+if __name__ == "__main__":
+    main()
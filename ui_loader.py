@@ -1,11 +1,96 @@
+import importlib.util
+from pathlib import Path
+
 from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile
+from PySide6.QtCore import QBuffer, QByteArray, QObject
+from PySide6 import QtWidgets
 from PySide6.QtWidgets import QWidget
 
-def carregar_ui(caminho_ui: str) -> QWidget:
-    loader = QUiLoader()
-    file = QFile(caminho_ui)
-    file.open(QFile.ReadOnly)
-    widget = loader.load(file)
-    file.close()
+# telas/ui_<nome>.py já importados (geradas por tools/compilar_telas.py)
+_modulos = {}
+# .ui sem módulo compilado em dia: caminho -> (mtime_ns, bytes do XML)
+_xml = {}
+# um único QUiLoader para todas as telas (criado no primeiro uso)
+_loader = None
+
+
+def caminho_compilado(caminho_ui) -> Path:
+    caminho_ui = Path(caminho_ui)
+    return caminho_ui.with_name(f"ui_{caminho_ui.stem}.py")
+
+
+def _modulo_compilado(caminho_ui: Path):
+    """Módulo compilado da tela, ou None se não existe / o .ui é mais novo."""
+    py = caminho_compilado(caminho_ui)
+    try:
+        if caminho_ui.stat().st_mtime_ns > py.stat().st_mtime_ns:
+            return None
+    except OSError:
+        return None
+    mod = _modulos.get(py)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(f"_tela_{py.stem}", py)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        _modulos[py] = mod
+    return mod
+
+
+def _carregar_compilado(mod) -> QWidget:
+    ui_cls = next(
+        v for k, v in vars(mod).items() if k.startswith("Ui_") and isinstance(v, type)
+    )
+    raiz = getattr(QtWidgets, getattr(mod, "CLASSE_RAIZ", "QWidget"), QWidget)
+    widget = raiz()
+    ui = ui_cls()
+    ui.setupUi(widget)
+    # mesmo acesso do QUiLoader: tela.btnVoltar, tela.scrollArea, ...
+    for nome, obj in vars(ui).items():
+        if isinstance(obj, QObject):
+            setattr(widget, nome, obj)
+    return widget
+
+
+def _bytes_xml(caminho_ui: Path) -> bytes:
+    mtime = caminho_ui.stat().st_mtime_ns
+    lido = _xml.get(caminho_ui)
+    if lido is None or lido[0] != mtime:
+        lido = _xml[caminho_ui] = (mtime, caminho_ui.read_bytes())
+    return lido[1]
+
+
+def _carregar_xml(caminho_ui: str) -> QWidget:
+    global _loader
+    if _loader is None:
+        _loader = QUiLoader()
+    buf = QBuffer()
+    buf.setData(QByteArray(_bytes_xml(Path(caminho_ui))))
+    buf.open(QBuffer.ReadOnly)
+    widget = _loader.load(buf)
+    buf.close()
+    if widget is None:
+        raise RuntimeError(_loader.errorString())
     return widget
+
+
+def pre_carregar(caminhos):
+    """Importa as telas compiladas (ou lê o XML das demais) antes do clique."""
+    for caminho in caminhos:
+        caminho = Path(caminho)
+        try:
+            if _modulo_compilado(caminho) is None:
+                _bytes_xml(caminho)
+        except Exception as e:
+            print(f"[AVISO] Não consegui pré-carregar {caminho.name}: {e}")
+
+
+def carregar_ui(caminho_ui: str) -> QWidget:
+    """Usa telas/ui_<nome>.py se estiver em dia; senão lê o .ui (QUiLoader)."""
+    try:
+        mod = _modulo_compilado(Path(caminho_ui))
+    except Exception as e:
+        print(f"[AVISO] Tela compilada inválida ({caminho_ui}): {e}")
+        mod = None
+    if mod is not None:
+        return _carregar_compilado(mod)
+    return _carregar_xml(caminho_ui)